@@ -155,7 +155,7 @@ def demonstrate_decision_logging():
     print("=" * 80)
     print()
     print(f"Decision logs saved to: runs/{run_id}/iter_{iteration}/reason_logs/")
-    print("Each agent's decisions are logged as JSON files for reproducibility.")
+    print("Each agent's decisions are logged as JSON Lines files for reproducibility.")
 
 
 if __name__ == "__main__":
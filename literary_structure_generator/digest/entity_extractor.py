@@ -186,6 +186,24 @@ def _levenshtein_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def _within_one_edit(s1: str, s2: str) -> bool:
+    """Check whether two strings are at Levenshtein distance <= 1 in linear time."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if len(s1) - len(s2) > 1:
+        return False
+
+    if len(s1) == len(s2):
+        return sum(c1 != c2 for c1, c2 in zip(s1, s2, strict=True)) <= 1
+
+    # One deletion from the longer string must make them equal
+    for i, (c1, c2) in enumerate(zip(s1, s2, strict=False)):
+        if c1 != c2:
+            return s1[i + 1 :] == s2[i:]
+    return True
+
+
 def _resolve_aliases(candidates: list[tuple[str, str, str]]) -> dict[str, dict]:
     """
     Resolve entity aliases and merge duplicates.
@@ -237,7 +255,7 @@ def _resolve_aliases(candidates: list[tuple[str, str, str]]) -> dict[str, dict]:
             if (
                 len(entity_text) <= 6
                 and entity_type == "PERSON"
-                and _levenshtein_distance(entity_lower, canonical_lower) <= 1
+                and _within_one_edit(entity_lower, canonical_lower)
             ):
                 info["surface_forms"].add(entity_text)
                 info["mentions"] += 1
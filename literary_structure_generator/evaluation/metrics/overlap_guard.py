@@ -12,7 +12,7 @@ Features:
 Enforces hard constraints:
     - max_ngram <= 12 tokens
     - overlap_pct <= 3%
-    - simhash_hamming >= 18
+    - simhash_hamming >= 36 (of 256 bits)
 
 Returns pass/fail and detailed metrics.
 """
@@ -70,7 +70,7 @@ def check_overlap_guard(
     exemplar: str,
     max_ngram: int = 12,
     max_overlap_pct: float = 0.03,
-    min_simhash_hamming: int = 18,
+    min_simhash_hamming: int = 36,
 ) -> dict[str, any]:
     """
     Perform all anti-plagiarism checks.
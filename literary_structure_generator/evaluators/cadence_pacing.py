@@ -8,9 +8,13 @@ Evaluates paragraph rhythm and pacing:
 Returns score 0..1
 """
 
-import re
+import numpy as np
 
 from literary_structure_generator.models.story_spec import StorySpec
+from literary_structure_generator.utils.text_utils import (
+    paragraph_word_counts,
+    tokenize_paragraphs,
+)
 
 
 def extract_paragraph_lengths(text: str) -> list[int]:
@@ -23,11 +27,8 @@ def extract_paragraph_lengths(text: str) -> list[int]:
     Returns:
         List of paragraph lengths
     """
-    # Split by double newlines
-    paragraphs = re.split(r"\n\n+", text.strip())
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
-
-    return [len(p.split()) for p in paragraphs]
+    # Shared with formfit and the report so each draft is counted once
+    return paragraph_word_counts(text)
 
 
 def classify_paragraph_cadence(para_lengths: list[int]) -> dict[str, float]:
@@ -47,8 +48,9 @@ def classify_paragraph_cadence(para_lengths: list[int]) -> dict[str, float]:
     short_threshold = 30  # words
     long_threshold = 60  # words
 
-    short_count = sum(1 for length in para_lengths if length < short_threshold)
-    long_count = sum(1 for length in para_lengths if length > long_threshold)
+    lengths = np.asarray(para_lengths)
+    short_count = int(np.count_nonzero(lengths < short_threshold))
+    long_count = int(np.count_nonzero(lengths > long_threshold))
     mixed_count = len(para_lengths) - short_count - long_count
 
     total = len(para_lengths)
@@ -115,16 +117,14 @@ def calculate_paragraph_variance(para_lengths: list[int]) -> float:
     if not para_lengths or len(para_lengths) == 1:
         return 0.0
 
-    mean_length = sum(para_lengths) / len(para_lengths)
+    lengths = np.asarray(para_lengths, dtype=np.float64)
+    mean_length = lengths.mean()
 
     if mean_length == 0:
         return 0.0
 
-    variance = sum((length - mean_length) ** 2 for length in para_lengths) / len(para_lengths)
-    std_dev = variance**0.5
-
-    # Coefficient of variation
-    return std_dev / mean_length
+    # Coefficient of variation (population standard deviation over mean)
+    return float(lengths.std() / mean_length)
 
 
 def check_paragraph_variance(
@@ -199,8 +199,7 @@ def estimate_valence_smoothness(text: str) -> float:
     ]
 
     # Split into segments (paragraphs)
-    paragraphs = re.split(r"\n\n+", text.strip())
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    paragraphs = tokenize_paragraphs(text)
 
     if len(paragraphs) < 2:
         return 1.0  # Too short to have transitions
@@ -12,6 +12,17 @@ Returns score 0..1
 import re
 from collections import defaultdict
 
+# Sentence boundaries and characters stripped from candidate entity tokens
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+_ENTITY_STRIP_RE = re.compile(r"[^\w\s-]")
+
+# Capitalized tokens that are never entities
+_ENTITY_STOPWORDS = frozenset({"I", "The", "A", "An"})
+
+# Lowercase hint words for entity type inference
+_PLACE_WORDS = frozenset({"hospital", "clinic", "office", "building", "house"})
+_ORG_WORDS = frozenset({"company", "department"})
+
 
 def extract_entities(text: str) -> list[tuple[str, str]]:
     """
@@ -27,27 +38,19 @@ def extract_entities(text: str) -> list[tuple[str, str]]:
 
     # Pattern for capitalized words (simple NER proxy)
     # Exclude common sentence starters
-    sentences = re.split(r"[.!?]+", text)
-
-    for sentence in sentences:
-        words = sentence.split()
-        for i, word in enumerate(words):
-            # Skip first word of sentence (often capitalized anyway)
-            if i == 0:
-                continue
-
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        # Skip first word of sentence (often capitalized anyway)
+        for word in sentence.split()[1:]:
             # Check if word is capitalized and not a common word
-            if word and word[0].isupper() and len(word) > 1:
+            if word[0].isupper() and len(word) > 1:
                 # Clean punctuation
-                clean_word = re.sub(r"[^\w\s-]", "", word)
-                if clean_word and clean_word not in ["I", "The", "A", "An"]:
+                clean_word = _ENTITY_STRIP_RE.sub("", word)
+                if clean_word and clean_word not in _ENTITY_STOPWORDS:
                     # Simple type inference
-                    if clean_word.lower() in ["hospital", "clinic", "office", "building", "house"]:
+                    lower_word = clean_word.lower()
+                    if lower_word in _PLACE_WORDS:
                         entity_type = "PLACE"
-                    elif clean_word.endswith("s") or clean_word.lower() in [
-                        "company",
-                        "department",
-                    ]:
+                    elif clean_word.endswith("s") or lower_word in _ORG_WORDS:
                         entity_type = "ORG"
                     else:
                         entity_type = "PERSON"  # Default assumption
@@ -70,13 +73,15 @@ def build_entity_map(entities: list[tuple[str, str]]) -> dict[str, dict]:
     entity_map = defaultdict(lambda: {"type": "", "mentions": 0, "positions": [], "aliases": set()})
 
     for i, (entity, entity_type) in enumerate(entities):
-        entity_map[entity]["type"] = entity_type
-        entity_map[entity]["mentions"] += 1
-        entity_map[entity]["positions"].append(i)
+        # Look the record up once per mention
+        record = entity_map[entity]
+        record["type"] = entity_type
+        record["mentions"] += 1
+        record["positions"].append(i)
 
         # Track potential aliases (entities with same first word)
         first_word = entity.split()[0] if " " in entity else entity
-        entity_map[entity]["aliases"].add(first_word)
+        record["aliases"].add(first_word)
 
     return dict(entity_map)
 
@@ -16,6 +16,7 @@ Workflow:
 
 import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from literary_structure_generator.evaluators.cadence_pacing import evaluate_cadence_pacing
@@ -45,6 +46,7 @@ from literary_structure_generator.models.eval_report import (
 from literary_structure_generator.models.exemplar_digest import ExemplarDigest
 from literary_structure_generator.models.generation_config import GenerationConfig
 from literary_structure_generator.models.story_spec import StorySpec
+from literary_structure_generator.utils.text_utils import paragraph_word_counts
 
 
 def run_all_evaluators(
@@ -71,6 +73,44 @@ def run_all_evaluators(
     """
     results = {}
 
+    if not use_llm_stylefit:
+        # Nothing to wait on, so skip the worker thread
+        results.update(_run_heuristic_evaluators(text, spec, digest, exemplar_text))
+        results["stylefit_llm"] = evaluate_stylefit_llm(text, spec, use_llm=False)
+        return results
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Start the LLM stylefit call first so its network wait overlaps the
+        # heuristic evaluators below
+        stylefit_llm_future = executor.submit(evaluate_stylefit_llm, text, spec, use_llm=True)
+        results.update(_run_heuristic_evaluators(text, spec, digest, exemplar_text))
+
+        # Run LLM stylefit (optional)
+        results["stylefit_llm"] = stylefit_llm_future.result()
+
+    return results
+
+
+def _run_heuristic_evaluators(
+    text: str,
+    spec: StorySpec,
+    digest: ExemplarDigest,
+    exemplar_text: str,
+) -> dict[str, any]:
+    """
+    Run the local (non-LLM) evaluation metrics.
+
+    Args:
+        text: Generated text to evaluate
+        spec: StorySpec used for generation
+        digest: ExemplarDigest for comparison
+        exemplar_text: Original exemplar text (for overlap check)
+
+    Returns:
+        Dictionary with heuristic metric results
+    """
+    results = {}
+
     # Run heuristic stylefit
     results["stylefit_rules"] = evaluate_stylefit_rules(text, spec)
 
@@ -89,9 +129,6 @@ def run_all_evaluators(
     # Run overlap guard
     results["overlap_guard"] = evaluate_overlap_guard(text, exemplar_text)
 
-    # Run LLM stylefit (optional)
-    results["stylefit_llm"] = evaluate_stylefit_llm(text, spec, use_llm=use_llm_stylefit)
-
     return results
 
 
@@ -500,8 +537,9 @@ def evaluate_draft(
     pass_fail = overlap_passed and score_passed
 
     # Calculate length metrics
-    word_count = len(text.split())
-    paragraph_count = len([p for p in text.split("\n\n") if p.strip()])
+    para_lengths = paragraph_word_counts(text)
+    word_count = sum(para_lengths)
+    paragraph_count = len(para_lengths)
 
     # Create EvalReport
     return EvalReport(
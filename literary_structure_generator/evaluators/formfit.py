@@ -9,9 +9,11 @@ Measures structural adherence to StorySpec:
 Returns score 0..1
 """
 
-import re
-
 from literary_structure_generator.models.story_spec import BeatSpec, StorySpec
+from literary_structure_generator.utils.text_utils import (
+    paragraph_word_counts,
+    tokenize_paragraphs,
+)
 
 
 def split_into_beats(text: str, num_beats: int) -> list[str]:
@@ -25,9 +27,8 @@ def split_into_beats(text: str, num_beats: int) -> list[str]:
     Returns:
         List of beat texts (approximate)
     """
-    # Split by double newlines or paragraph markers
-    paragraphs = re.split(r"\n\n+", text.strip())
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    # Split by blank lines
+    paragraphs = tokenize_paragraphs(text)
 
     if not paragraphs:
         return [""] * num_beats
@@ -195,20 +196,18 @@ def estimate_scene_summary_ratio(text: str) -> float:
     Returns:
         Scene ratio (0..1)
     """
-    paragraphs = re.split(r"\n\n+", text.strip())
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    # Count words per paragraph
+    para_lengths = paragraph_word_counts(text)
 
-    if not paragraphs:
+    if not para_lengths:
         return 0.5
 
-    # Count words per paragraph
-    para_lengths = [len(p.split()) for p in paragraphs]
     avg_length = sum(para_lengths) / len(para_lengths)
 
     # Scene paragraphs are above average, summary below
     scene_paras = sum(1 for length in para_lengths if length > avg_length)
 
-    return scene_paras / len(paragraphs)
+    return scene_paras / len(para_lengths)
 
 
 def check_scene_summary_ratio(
@@ -31,6 +31,12 @@ def extract_motif_mentions(text: str, motifs: list[str]) -> dict[str, int]:
     for motif in motifs:
         # Convert motif to regex pattern (handle multi-word motifs)
         motif_lower = motif.lower()
+
+        # Plain substring test is a cheap C scan; absent motifs skip the regex
+        if motif_lower not in text_lower:
+            motif_counts[motif] = 0
+            continue
+
         # Use word boundaries for better matching
         pattern = r"\b" + re.escape(motif_lower) + r"\b"
         matches = re.findall(pattern, text_lower)
@@ -9,9 +9,31 @@ Re-checks overlaps with exemplar text:
 Returns pass/fail + stats
 """
 
+import re
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 from literary_structure_generator.utils.similarity import calculate_simhash, hamming_distance
 
 
+@lru_cache(maxsize=16)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """
+    Tokenize text, cached so the exemplar is split once across evaluations.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Tuple of lowercase words
+    """
+    # Remove punctuation and convert to lowercase
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return tuple(text.split())
+
+
 def tokenize(text: str) -> list[str]:
     """
     Tokenize text into words.
@@ -22,12 +44,7 @@ def tokenize(text: str) -> list[str]:
     Returns:
         List of lowercase words
     """
-    import re
-
-    # Remove punctuation and convert to lowercase
-    text = re.sub(r"[^\w\s]", " ", text.lower())
-    words = text.split()
-    return [w for w in words if w]
+    return list(_tokenize(text))
 
 
 def generate_ngrams(tokens: list[str], n: int) -> set[tuple]:
@@ -52,6 +69,25 @@ def generate_ngrams(tokens: list[str], n: int) -> set[tuple]:
     return ngrams
 
 
+def _encode_ngrams(ids: np.ndarray, n: int, base: int) -> np.ndarray:
+    """
+    Encode the distinct n-grams of a token id array as integers.
+
+    Args:
+        ids: Token ids, each below base
+        n: N-gram size
+        base: Vocabulary size (base**n must fit in int64)
+
+    Returns:
+        Sorted array of unique n-gram codes
+    """
+    if n > len(ids):
+        return np.empty(0, dtype=np.int64)
+
+    weights = base ** np.arange(n - 1, -1, -1, dtype=np.int64)
+    return np.unique(sliding_window_view(ids, n) @ weights)
+
+
 def find_max_ngram_overlap(text1: str, text2: str, max_n: int = 20) -> int:
     """
     Find maximum shared n-gram length between two texts.
@@ -67,17 +103,18 @@ def find_max_ngram_overlap(text1: str, text2: str, max_n: int = 20) -> int:
     tokens1 = tokenize(text1)
     tokens2 = tokenize(text2)
 
-    # Start from max_n and work down
-    for n in range(max_n, 0, -1):
-        ngrams1 = generate_ngrams(tokens1, n)
-        ngrams2 = generate_ngrams(tokens2, n)
+    # Any shared n-gram contains a shared (n-1)-gram, so binary search for
+    # the longest shared length instead of building sets for every n
+    low = 0
+    high = max(0, min(max_n, len(tokens1), len(tokens2)))
+    while low < high:
+        n = (low + high + 1) // 2
+        if generate_ngrams(tokens1, n) & generate_ngrams(tokens2, n):
+            low = n
+        else:
+            high = n - 1
 
-        # Check for overlap
-        overlap = ngrams1 & ngrams2
-        if overlap:
-            return n
-
-    return 0
+    return low
 
 
 def calculate_ngram_overlap_percentage(text1: str, text2: str, n: int = 4) -> float:
@@ -95,14 +132,46 @@ def calculate_ngram_overlap_percentage(text1: str, text2: str, n: int = 4) -> fl
     tokens1 = tokenize(text1)
     tokens2 = tokenize(text2)
 
-    ngrams1 = generate_ngrams(tokens1, n)
-    ngrams2 = generate_ngrams(tokens2, n)
+    # Map tokens to shared integer ids
+    vocab: dict[str, int] = {}
+    ids1 = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens1), dtype=np.int64)
+    ids2 = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens2), dtype=np.int64)
+    base = max(len(vocab), 1)
+
+    if n < 1 or base**n >= 2**63:
+        # N-gram codes would not fit in int64; compare tuples directly
+        ngrams1 = generate_ngrams(tokens1, n)
+        ngrams2 = generate_ngrams(tokens2, n)
+
+        if not ngrams1:
+            return 0.0
 
-    if not ngrams1:
+        overlap = ngrams1 & ngrams2
+        return len(overlap) / len(ngrams1)
+
+    if n > len(tokens1):
         return 0.0
 
-    overlap = ngrams1 & ngrams2
-    return len(overlap) / len(ngrams1)
+    # Encode each n-gram exactly as a base-|vocab| integer and intersect
+    codes1 = _encode_ngrams(ids1, n, base)
+    codes2 = _encode_ngrams(ids2, n, base)
+    shared_codes = np.intersect1d(codes1, codes2, assume_unique=True)
+    return len(shared_codes) / len(codes1)
+
+
+@lru_cache(maxsize=16)
+def _simhash(text: str, num_bits: int) -> int:
+    """
+    Calculate SimHash, cached so the exemplar is hashed once across evaluations.
+
+    Args:
+        text: Input text
+        num_bits: Number of bits for SimHash
+
+    Returns:
+        SimHash as integer
+    """
+    return calculate_simhash(text, num_bits=num_bits)
 
 
 def check_simhash_distance(text1: str, text2: str, num_bits: int = 256) -> int:
@@ -117,8 +186,8 @@ def check_simhash_distance(text1: str, text2: str, num_bits: int = 256) -> int:
     Returns:
         Hamming distance
     """
-    hash1 = calculate_simhash(text1, num_bits=num_bits)
-    hash2 = calculate_simhash(text2, num_bits=num_bits)
+    hash1 = _simhash(text1, num_bits)
+    hash2 = _simhash(text2, num_bits)
 
     return hamming_distance(hash1, hash2)
 
@@ -128,7 +197,7 @@ def evaluate_overlap_guard(
     exemplar_text: str,
     max_ngram_threshold: int = 12,
     max_overlap_pct: float = 0.03,
-    min_simhash_hamming: int = 18,
+    min_simhash_hamming: int = 36,
 ) -> dict[str, any]:
     """
     Evaluate overlap with exemplar text.
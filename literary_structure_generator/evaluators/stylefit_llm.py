@@ -10,16 +10,26 @@ Returns score 0..1
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from literary_structure_generator.llm.router import get_client
 from literary_structure_generator.models.story_spec import StorySpec
 
+# Score patterns in priority order: a decimal anywhere wins over an integer
+_SCORE_PATTERNS = (
+    re.compile(r"(\d+\.\d+)"),  # Decimal number
+    re.compile(r"(\d+)"),  # Integer
+)
 
+
+@lru_cache(maxsize=8)
 def load_prompt_template(template_name: str = "stylefit_eval.v1.md") -> str:
     """
     Load prompt template from prompts directory.
 
+    Cached per template name, since it is loaded on every stylefit evaluation.
+
     Args:
         template_name: Template file name
 
@@ -126,13 +136,8 @@ def parse_llm_score(response: str) -> float:
     """
     # Try to find a number in the response
     # Look for patterns like "0.85" or "Score: 0.85"
-    patterns = [
-        r"(\d+\.\d+)",  # Decimal number
-        r"(\d+)",  # Integer
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, response)
+    for pattern in _SCORE_PATTERNS:
+        match = pattern.search(response)
         if match:
             try:
                 score = float(match.group(1))
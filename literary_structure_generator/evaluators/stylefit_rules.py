@@ -12,9 +12,17 @@ Returns score 0..1
 """
 
 import re
+from functools import lru_cache
 
 from literary_structure_generator.models.story_spec import StorySpec
-from literary_structure_generator.utils.profanity import count_bleeps
+from literary_structure_generator.utils.profanity import contains_profanity
+
+# Sentence-ending punctuation and conjunction cues shared by the sentence metrics
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_COORD_CONJ_RE = re.compile(r"\b(and|but|or)\b", re.IGNORECASE)
+_SUBORD_CONJ_RE = re.compile(
+    r"\b(because|although|though|if|when|while|since|unless|until)\b", re.IGNORECASE
+)
 
 
 def check_person_consistency(text: str, target_person: str) -> float:
@@ -83,6 +91,23 @@ def check_tense_consistency(text: str, target_tense: str) -> float:
     return min(1.0, ratio * 1.3)
 
 
+@lru_cache(maxsize=8)
+def _split_sentences(text: str) -> tuple[str, ...]:
+    """
+    Split text on sentence-ending punctuation.
+
+    Cached so the sentence-length and parataxis checks share one split of
+    the same draft.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Raw pieces between punctuation runs (may include empty strings)
+    """
+    return tuple(_SENTENCE_END_RE.split(text))
+
+
 def calculate_avg_sentence_length(text: str) -> float:
     """
     Calculate average sentence length in words.
@@ -94,8 +119,7 @@ def calculate_avg_sentence_length(text: str) -> float:
         Average sentence length
     """
     # Split by sentence-ending punctuation
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = [s.strip() for s in _split_sentences(text) if s.strip()]
 
     if not sentences:
         return 0.0
@@ -141,12 +165,8 @@ def calculate_parataxis_ratio(text: str) -> float:
         Parataxis ratio 0..1 (higher = more paratactic/simple)
     """
     # Count coordinating conjunctions (and, but, or) vs subordinating (because, although, if, when)
-    coord_conj = len(re.findall(r"\b(and|but|or)\b", text, re.IGNORECASE))
-    subord_conj = len(
-        re.findall(
-            r"\b(because|although|though|if|when|while|since|unless|until)\b", text, re.IGNORECASE
-        )
-    )
+    coord_conj = len(_COORD_CONJ_RE.findall(text))
+    subord_conj = len(_SUBORD_CONJ_RE.findall(text))
 
     # Count commas (proxy for clause complexity)
     commas = text.count(",")
@@ -159,7 +179,7 @@ def calculate_parataxis_ratio(text: str) -> float:
     coord_ratio = coord_conj / total_conj
 
     # Adjust by comma density
-    sentences = len(re.split(r"[.!?]+", text))
+    sentences = len(_split_sentences(text))
     comma_density = commas / max(1, sentences)
 
     # Low comma density and high coordination = paratactic
@@ -244,11 +264,8 @@ def check_clean_mode(text: str) -> bool:
     Returns:
         True if clean (no unfiltered profanity), False otherwise
     """
-    # Use the universal profanity counting function
-    profanity_count = count_bleeps(text)
-
-    # If profanity is detected, text is not clean
-    return profanity_count == 0
+    # Use the universal profanity matcher; one hit is enough to fail
+    return not contains_profanity(text)
 
 
 def evaluate_stylefit_rules(text: str, spec: StorySpec) -> dict[str, float]:
@@ -13,7 +13,9 @@ Features:
 
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from literary_structure_generator.generation.guards import (
@@ -25,26 +27,25 @@ from literary_structure_generator.llm.router import get_client
 from literary_structure_generator.models.story_spec import BeatSpec, StorySpec
 
 
-def build_beat_prompt(beat_spec: BeatSpec, story_spec: StorySpec) -> str:
+@lru_cache(maxsize=1)
+def _load_beat_template() -> str:
     """
-    Build prompt for beat generation from templates.
+    Load the beat generation prompt template.
 
-    Args:
-        beat_spec: Beat specification
-        story_spec: Story specification
+    Cached so the template file is read once per process rather than once
+    per beat and retry.
 
     Returns:
-        Formatted prompt string
+        Template string
     """
-    # Load beat generation prompt template
     prompt_path = Path(__file__).parent.parent.parent / "prompts" / "beat_generate.v1.md"
 
     if prompt_path.exists():
         with open(prompt_path, encoding="utf-8") as f:
-            template = f.read()
-    else:
-        # Fallback minimal template
-        template = """# Beat Generation
+            return f.read()
+
+    # Fallback minimal template
+    return """# Beat Generation
 
 **Function:** {function}
 **Summary:** {summary}
@@ -53,6 +54,20 @@ def build_beat_prompt(beat_spec: BeatSpec, story_spec: StorySpec) -> str:
 Generate prose for this beat matching the specified voice and style.
 """
 
+
+def build_beat_prompt(beat_spec: BeatSpec, story_spec: StorySpec) -> str:
+    """
+    Build prompt for beat generation from templates.
+
+    Args:
+        beat_spec: Beat specification
+        story_spec: Story specification
+
+    Returns:
+        Formatted prompt string
+    """
+    template = _load_beat_template()
+
     # Extract voice and form parameters
     voice = story_spec.voice
     form = story_spec.form
@@ -112,6 +127,9 @@ def generate_beat_text(
     memory: dict | None = None,
     exemplar: str | None = None,
     max_retries: int = 2,
+    prefetched_text: str | None = None,
+    prefetched_usage: dict | None = None,
+    prefetched_model: str | None = None,
 ) -> dict:
     """
     Generate text for a single beat with overlap guard.
@@ -122,6 +140,10 @@ def generate_beat_text(
         memory: Optional context from previous beats
         exemplar: Optional exemplar text for overlap checking
         max_retries: Maximum regeneration attempts on guard failure
+        prefetched_text: Optional raw completion to use for the first attempt
+            instead of calling the LLM (e.g. from a batched request)
+        prefetched_usage: Token usage attributed to prefetched_text
+        prefetched_model: Model that produced prefetched_text
 
     Returns:
         Dictionary with:
@@ -133,7 +155,8 @@ def generate_beat_text(
     if memory is None:
         memory = {}
 
-    client = get_client("beat_generator")
+    # Created on first use so a prefetched beat that passes needs no client
+    client = None
 
     for attempt in range(max_retries + 1):
         # Build prompt
@@ -148,7 +171,21 @@ def generate_beat_text(
             )
 
         # Generate beat text
-        raw_text = client.complete(prompt)
+        if attempt == 0 and prefetched_text is not None:
+            raw_text = prefetched_text
+            usage = prefetched_usage
+            model = prefetched_model
+        else:
+            if client is None:
+                client = get_client("beat_generator")
+            raw_text = client.complete(prompt)
+            usage = client.get_usage()
+            model = client.model
+
+        if usage is None or model is None:
+            client = client or get_client("beat_generator")
+            usage = usage if usage is not None else client.get_usage()
+            model = model if model is not None else client.model
 
         # Apply clean mode if grit not allowed
         clean_text = apply_clean_mode_if_needed(raw_text, not story_spec.voice.profanity.allowed)
@@ -166,12 +203,11 @@ def generate_beat_text(
 
         if guard_result["passed"]:
             # Calculate metadata
-            usage = client.get_usage()
             prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
             text_hash = hashlib.sha256(clean_text.encode()).hexdigest()[:16]
 
             metadata = {
-                "model": client.model,
+                "model": model,
                 "template_version": "beat_generate.v1",
                 "params_hash": prompt_hash,
                 "input_hash": prompt_hash,
@@ -188,11 +224,10 @@ def generate_beat_text(
             }
 
     # All attempts failed - return last attempt with warning
-    usage = client.get_usage()
     return {
         "text": clean_text,
         "metadata": {
-            "model": client.model,
+            "model": model,
             "template_version": "beat_generate.v1",
             "tokens": usage,
             "attempt": max_retries + 1,
@@ -204,6 +239,107 @@ def generate_beat_text(
     }
 
 
+def generate_beats(
+    spec: StorySpec,
+    exemplar: str | None = None,
+    max_retries: int = 2,
+    max_workers: int = 4,
+) -> list[dict]:
+    """
+    Generate text for every beat in the spec's beat map.
+
+    Beat prompts depend only on the beat and the spec, not on earlier beat
+    text, so the LLM calls run concurrently while results keep beat order.
+
+    Args:
+        spec: Story specification
+        exemplar: Optional exemplar text for overlap checking
+        max_retries: Maximum regeneration attempts per beat on guard failure
+        max_workers: Maximum number of beats generated concurrently (default: 4)
+
+    Returns:
+        List of beat results from generate_beat_text, in beat order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda beat_spec: generate_beat_text(
+                    beat_spec, spec, exemplar=exemplar, max_retries=max_retries
+                ),
+                spec.form.beat_map,
+            )
+        )
+
+
+def _split_usage(usage: dict, n: int) -> list[dict]:
+    """
+    Split a batched request's token usage evenly across its n completions.
+
+    Args:
+        usage: Usage dictionary for the whole request
+        n: Number of completions
+
+    Returns:
+        List of n usage dictionaries whose values sum to the original
+    """
+    shares: list[dict[str, int]] = [{} for _ in range(n)]
+    for key, value in usage.items():
+        base, remainder = divmod(value, n)
+        for i, share in enumerate(shares):
+            share[key] = base + (1 if i < remainder else 0)
+    return shares
+
+
+def generate_beat_sets(
+    spec: StorySpec,
+    n: int,
+    exemplar: str | None = None,
+    max_retries: int = 2,
+    max_workers: int = 4,
+) -> list[list[dict]]:
+    """
+    Generate n independent sets of beats from the same spec.
+
+    Every set shares the same beat prompts, so each beat position is
+    requested once with complete_n and the n completions are split across
+    the sets, each carrying an even share of the request's token usage.
+    Guard retries still run per set.
+
+    Args:
+        spec: Story specification
+        n: Number of beat sets (one per candidate)
+        exemplar: Optional exemplar text for overlap checking
+        max_retries: Maximum regeneration attempts per beat on guard failure
+        max_workers: Maximum number of beat positions generated concurrently
+
+    Returns:
+        List of n beat-result lists, each in beat order
+    """
+
+    def generate_position(beat_spec: BeatSpec) -> list[dict]:
+        # One client per position so concurrent batches don't share usage state
+        client = get_client("beat_generator")
+        texts = client.complete_n(build_beat_prompt(beat_spec, spec), n)
+        usages = _split_usage(client.get_usage(), n)
+        return [
+            generate_beat_text(
+                beat_spec,
+                spec,
+                exemplar=exemplar,
+                max_retries=max_retries,
+                prefetched_text=text,
+                prefetched_usage=usage,
+                prefetched_model=client.model,
+            )
+            for text, usage in zip(texts, usages, strict=True)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        per_position = list(executor.map(generate_position, spec.form.beat_map))
+
+    return [[position[i] for position in per_position] for i in range(n)]
+
+
 def stitch_beats(beat_texts: list[str]) -> str:
     """
     Stitch individual beat texts into coherent story.
@@ -225,12 +361,13 @@ def run_draft_generation(
     spec: StorySpec,
     exemplar: str | None = None,
     output_dir: str | None = None,
+    max_workers: int = 4,
 ) -> dict:
     """
     Run complete draft generation pipeline.
 
     Process:
-        1. Generate text for each beat
+        1. Generate text for each beat (concurrently)
         2. Stitch beats together
         3. Run repair pass
         4. Re-check overlap guard
@@ -241,6 +378,7 @@ def run_draft_generation(
         spec: Story specification
         exemplar: Optional exemplar text for overlap checking
         output_dir: Optional output directory (default: /runs/)
+        max_workers: Maximum number of beats generated concurrently (default: 4)
 
     Returns:
         Dictionary with:
@@ -251,21 +389,8 @@ def run_draft_generation(
             - guard_results: Overlap guard results
     """
     # Generate beats
-    beat_results = []
-    beat_texts = []
-
-    memory = {}  # Context for beat generation
-
-    for beat_spec in spec.form.beat_map:
-        beat_result = generate_beat_text(beat_spec, spec, memory=memory, exemplar=exemplar)
-        beat_results.append(beat_result)
-        beat_texts.append(beat_result["text"])
-
-        # Update memory for next beat
-        memory[beat_spec.id] = {
-            "text": beat_result["text"],
-            "function": beat_spec.function,
-        }
+    beat_results = generate_beats(spec, exemplar=exemplar, max_workers=max_workers)
+    beat_texts = [beat_result["text"] for beat_result in beat_results]
 
     # Stitch beats
     stitched = stitch_beats(beat_texts)
@@ -363,7 +488,7 @@ def save_artifacts(
     # Save story spec
     spec_path = output_path / "story_spec.json"
     with open(spec_path, "w", encoding="utf-8") as f:
-        json.dump(spec.model_dump(), f, indent=2)
+        f.write(spec.model_dump_json(indent=2))
 
     # Save beat results
     beats_path = output_path / "beat_results.json"
@@ -32,7 +32,8 @@ def max_ngram_overlap(text: str, exemplar_text: str, n: int = 12) -> float:
     text_tokens = text.lower().split()
     exemplar_tokens = exemplar_text.lower().split()
 
-    if not text_tokens or not exemplar_tokens:
+    # No n-grams of the minimum size can be formed from either side
+    if len(text_tokens) < 3 or len(exemplar_tokens) < 3:
         return 0.0
 
     max_overlap = 0.0
@@ -81,37 +82,48 @@ def check_overlap_guard(
     exemplar: str,
     max_ngram: int = 12,
     max_overlap_pct: float = 0.03,
-    min_simhash_hamming: int = 18,
+    min_simhash_hamming: int = 36,
+    ngram_gate_distance: int | None = None,
 ) -> dict:
     """
     Perform all anti-plagiarism checks.
 
+    The SimHash check runs first because it is the cheaper of the two. When
+    ngram_gate_distance is set and the SimHash distance reaches it, the texts
+    are treated as unrelated and the n-gram check is skipped.
+
     Args:
         text: Generated text to check
         exemplar: Exemplar text to compare against
         max_ngram: Maximum n-gram size to check (default: 12)
         max_overlap_pct: Maximum allowed overlap percentage (default: 0.03)
-        min_simhash_hamming: Minimum required SimHash Hamming distance (default: 18)
+        min_simhash_hamming: Minimum required SimHash Hamming distance out of 256 bits (default: 36)
+        ngram_gate_distance: SimHash distance at or above which the n-gram
+            check is skipped (default: None, always run it)
 
     Returns:
         Dictionary with:
             - passed: bool (True if all checks pass)
-            - ngram_overlap: float (actual overlap)
+            - ngram_overlap: float (actual overlap, None if skipped)
             - simhash_distance: int (actual distance)
             - violations: list of str (constraint violations)
     """
     violations = []
 
-    # Check n-gram overlap
-    ngram_overlap = max_ngram_overlap(text, exemplar, n=max_ngram)
-    if ngram_overlap > max_overlap_pct:
-        violations.append(f"N-gram overlap {ngram_overlap:.3f} exceeds threshold {max_overlap_pct}")
-
     # Check SimHash distance
     simhash_dist = simhash_distance(text, exemplar)
     if simhash_dist < min_simhash_hamming:
         violations.append(f"SimHash distance {simhash_dist} below minimum {min_simhash_hamming}")
 
+    # Check n-gram overlap
+    ngram_overlap = None
+    if ngram_gate_distance is None or simhash_dist < ngram_gate_distance:
+        ngram_overlap = max_ngram_overlap(text, exemplar, n=max_ngram)
+        if ngram_overlap > max_overlap_pct:
+            violations.insert(
+                0, f"N-gram overlap {ngram_overlap:.3f} exceeds threshold {max_overlap_pct}"
+            )
+
     return {
         "passed": len(violations) == 0,
         "ngram_overlap": ngram_overlap,
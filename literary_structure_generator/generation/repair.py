@@ -9,11 +9,47 @@ LLM-based repair for generated text:
     - Grit filtering with [bleep] replacement
 """
 
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
 from literary_structure_generator.llm.router import get_client
 from literary_structure_generator.models.story_spec import StorySpec
 from literary_structure_generator.utils.profanity import structural_bleep
 
 
+@lru_cache(maxsize=1)
+def _load_repair_template() -> str:
+    """
+    Load the repair pass prompt template.
+
+    Cached so the template file is read once per process rather than once
+    per repair call.
+
+    Returns:
+        Template string
+    """
+    prompt_path = Path(__file__).parent.parent.parent / "prompts" / "repair_pass.v1.md"
+
+    if prompt_path.exists():
+        with open(prompt_path, encoding="utf-8") as f:
+            return f.read()
+
+    # Fallback template
+    return """# Repair Pass
+
+**Original Text:**
+```
+{text}
+```
+
+**Constraints:**
+{constraints}
+
+**Repaired Text:**"""
+
+
 def calculate_paragraph_variance(text: str) -> float:
     """
     Calculate variance in paragraph lengths.
@@ -27,18 +63,14 @@ def calculate_paragraph_variance(text: str) -> float:
     if not text:
         return 0.0
 
-    # Split into paragraphs
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+    # Token count of each non-empty paragraph
+    lengths = np.fromiter((len(p.split()) for p in text.split("\n\n") if p.strip()), dtype=np.int64)
 
-    if len(paragraphs) < 2:
+    if lengths.size < 2:
         return 0.0
 
-    # Calculate lengths
-    lengths = [len(p.split()) for p in paragraphs]
-
-    # Calculate variance
-    mean = sum(lengths) / len(lengths)
-    return sum((x - mean) ** 2 for x in lengths) / len(lengths)
+    # Population variance, as the rebalancing threshold expects
+    return float(lengths.var())
 
 
 def build_repair_notes(text: str, spec: StorySpec, issues: list[str]) -> dict:
@@ -105,27 +137,7 @@ def repair_text(
         # No issues to fix, return as-is
         return stitched
 
-    # Load repair prompt template
-    from pathlib import Path
-
-    prompt_path = Path(__file__).parent.parent.parent / "prompts" / "repair_pass.v1.md"
-
-    if prompt_path.exists():
-        with open(prompt_path, encoding="utf-8") as f:
-            template = f.read()
-    else:
-        # Fallback template
-        template = """# Repair Pass
-
-**Original Text:**
-```
-{text}
-```
-
-**Constraints:**
-{constraints}
-
-**Repaired Text:**"""
+    template = _load_repair_template()
 
     # Format prompt
     prompt = template.replace("{text}", stitched).replace("{constraints}", constraints_text)
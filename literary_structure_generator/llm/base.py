@@ -38,6 +38,7 @@ class LLMClient(ABC):
         self.max_tokens = max_tokens
         self.seed = seed
         self.timeout_s = timeout_s
+        self._last_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
     @abstractmethod
     def complete(self, prompt: str, **kwargs) -> str:
@@ -55,6 +56,32 @@ class LLMClient(ABC):
             Exception: If API call fails
         """
 
+    def complete_n(self, prompt: str, n: int, **kwargs) -> list[str]:
+        """
+        Generate n independent completions for the same prompt.
+
+        Providers that can sample several completions from one request
+        override this; the default issues n separate calls. Either way,
+        get_usage() afterwards reports the combined usage of all n.
+
+        Args:
+            prompt: Input prompt text
+            n: Number of completions
+            **kwargs: Additional parameters to override defaults
+
+        Returns:
+            List of n generated text completions
+        """
+        texts = []
+        totals = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        for _ in range(n):
+            texts.append(self.complete(prompt, **kwargs))
+            for key, value in self.get_usage().items():
+                totals[key] = totals.get(key, 0) + value
+
+        self._last_usage = totals
+        return texts
+
     @abstractmethod
     def get_usage(self) -> dict:
         """
@@ -7,9 +7,34 @@ Connects to OpenAI API with retry logic and error handling.
 import os
 import random
 import time
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from literary_structure_generator.llm.base import LLMClient
 
+if TYPE_CHECKING:
+    import openai
+
+
+@lru_cache(maxsize=8)
+def _shared_openai_client(api_key: str, timeout_s: float) -> "openai.OpenAI":
+    """
+    Get a process-wide OpenAI SDK client for the given key and timeout.
+
+    The SDK client is thread-safe and owns the HTTP connection pool, so
+    sharing it lets every OpenAIClient reuse keep-alive connections.
+
+    Args:
+        api_key: OpenAI API key
+        timeout_s: Request timeout in seconds
+
+    Returns:
+        openai.OpenAI instance
+    """
+    import openai
+
+    return openai.OpenAI(api_key=api_key, timeout=timeout_s)
+
 
 class OpenAIClient(LLMClient):
     """
@@ -44,7 +69,7 @@ class OpenAIClient(LLMClient):
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable must be set to use OpenAIClient")
 
-        self.client = openai.OpenAI(api_key=api_key, timeout=self.timeout_s)
+        self.client = _shared_openai_client(api_key, self.timeout_s)
         self._last_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
     def complete(self, prompt: str, max_retries: int = 2, **kwargs) -> str:
@@ -59,6 +84,27 @@ class OpenAIClient(LLMClient):
         Returns:
             Generated text
 
+        Raises:
+            Exception: If all retries fail
+        """
+        return self.complete_n(prompt, 1, max_retries=max_retries, **kwargs)[0]
+
+    def complete_n(self, prompt: str, n: int, max_retries: int = 2, **kwargs) -> list[str]:
+        """
+        Generate n completions from a single request with retry logic.
+
+        The prompt is sent once with the API's n parameter, so the shared
+        prompt is only processed and billed once.
+
+        Args:
+            prompt: Input prompt
+            n: Number of completions
+            max_retries: Number of retries on failure
+            **kwargs: Override parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            List of n generated texts
+
         Raises:
             Exception: If all retries fail
         """
@@ -77,6 +123,9 @@ class OpenAIClient(LLMClient):
         if self.seed is not None:
             params["seed"] = self.seed
 
+        if n > 1:
+            params["n"] = n
+
         last_error = None
         for attempt in range(max_retries + 1):
             try:
@@ -92,9 +141,9 @@ class OpenAIClient(LLMClient):
                         "total_tokens": response.usage.total_tokens,
                     }
 
-                # Extract and return text
-                if response.choices and len(response.choices) > 0:
-                    return response.choices[0].message.content.strip()
+                # Extract and return texts
+                if response.choices and len(response.choices) >= n:
+                    return [choice.message.content.strip() for choice in response.choices[:n]]
 
                 raise ValueError("Empty response from OpenAI API")  # noqa: TRY301
 
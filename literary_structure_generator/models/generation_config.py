@@ -48,7 +48,7 @@ class ConstraintEnforcement(BaseModel):
 
     max_ngram: int = Field(default=12, description="Maximum shared n-gram length with exemplar")
     simhash_hamming_min: int = Field(
-        default=18, description="Minimum SimHash Hamming distance from exemplar"
+        default=36, description="Minimum 256-bit SimHash Hamming distance from exemplar"
     )
     forbidden_lexicon: list[str] = Field(
         default_factory=list, description="Forbidden words or phrases"
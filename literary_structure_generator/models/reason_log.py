@@ -27,9 +27,9 @@ class ReasonLog(BaseModel):
     schema_version: str = Field(
         default="ReasonLog@1", description="Schema version identifier", alias="schema"
     )
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
-        description="ISO 8601 timestamp of decision",
+    timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Timezone-aware time of decision (ISO 8601 in JSON)",
     )
     run_id: str = Field(..., description="Unique run identifier")
     iteration: int = Field(..., description="Iteration number (0-indexed)")
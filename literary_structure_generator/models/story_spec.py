@@ -214,7 +214,9 @@ class AntiPlagiarism(BaseModel):
 
     max_ngram: int = Field(default=12, description="Maximum shared n-gram length")
     overlap_pct: float = Field(default=0.03, description="Maximum overlap percentage")
-    simhash_hamming_min: int = Field(default=18, description="Minimum SimHash Hamming distance")
+    simhash_hamming_min: int = Field(
+        default=36, description="Minimum 256-bit SimHash Hamming distance"
+    )
 
 
 class LengthConstraints(BaseModel):
@@ -15,6 +15,7 @@ Each decision is logged via log_decision() for reproducibility.
 
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -27,7 +28,7 @@ from literary_structure_generator.models.eval_report import (
 )
 from literary_structure_generator.models.exemplar_digest import ExemplarDigest
 from literary_structure_generator.models.generation_config import GenerationConfig
-from literary_structure_generator.models.story_spec import StorySpec
+from literary_structure_generator.models.story_spec import BeatSpec, StorySpec
 from literary_structure_generator.utils.decision_logger import log_decision
 
 
@@ -43,6 +44,7 @@ class Optimizer:
         candidates: int = 3,
         early_stop_delta: float = 0.01,
         run_id: str | None = None,
+        stagnation_rounds: int = 2,
     ):
         """
         Initialize the optimizer.
@@ -52,11 +54,14 @@ class Optimizer:
             candidates: Number of candidate drafts to generate per iteration
             early_stop_delta: Minimum improvement required to continue optimization
             run_id: Unique run identifier (auto-generated if None)
+            stagnation_rounds: Consecutive iterations without an improvement of at
+                least early_stop_delta before stopping early
         """
         self.max_iters = max_iters
         self.candidates = candidates
         self.early_stop_delta = early_stop_delta
         self.run_id = run_id or f"opt_{uuid.uuid4().hex[:8]}"
+        self.stagnation_rounds = stagnation_rounds
 
     def suggest(self, spec: StorySpec, report: EvalReport) -> StorySpec:
         """
@@ -75,8 +80,8 @@ class Optimizer:
         Returns:
             Updated StorySpec with adjustments
         """
-        # Create a deep copy to avoid mutating the original
-        new_spec = spec.model_copy(deep=True)
+        # Copy only the branches adjusted below so the original is not mutated
+        new_spec = self._copy_adjustable(spec)
 
         # Process tuning suggestions from evaluators
         for suggestion in report.tuning_suggestions:
@@ -146,6 +151,7 @@ class Optimizer:
                 "max_iters": self.max_iters,
                 "candidates": self.candidates,
                 "early_stop_delta": self.early_stop_delta,
+                "stagnation_rounds": self.stagnation_rounds,
             },
             output_dir=output_dir,
         )
@@ -173,6 +179,7 @@ class Optimizer:
 
             # Update history
             history.append(iteration_result)
+            self._append_history(iteration_result, output_dir)
 
             # Check if this is the best so far
             iter_score = iteration_result["best_score"]
@@ -183,7 +190,13 @@ class Optimizer:
                 best_spec = iteration_result["best_spec"]
                 best_draft = iteration_result["best_draft"]
                 best_report = iteration_result["best_report"]
-                no_improvement_count = 0
+
+                # Only a significant improvement resets the stagnation counter;
+                # smaller gains are kept but still count toward early stopping
+                if improvement >= self.early_stop_delta:
+                    no_improvement_count = 0
+                else:
+                    no_improvement_count += 1
 
                 log_decision(
                     run_id=self.run_id,
@@ -212,7 +225,7 @@ class Optimizer:
                 )
 
             # Early stopping check
-            if improvement < self.early_stop_delta and no_improvement_count >= 2:
+            if no_improvement_count >= self.stagnation_rounds:
                 log_decision(
                     run_id=self.run_id,
                     iteration=iteration,
@@ -273,50 +286,24 @@ class Optimizer:
             output_dir=output_dir,
         )
 
-        # Generate candidates
-        candidates = []
-        for i in range(self.candidates):
-            candidate_id = f"{self.run_id}_iter{iteration}_cand{i}"
-
-            # Generate draft using run_draft_generation
-            draft_result = run_draft_generation(
-                spec=spec,
-                exemplar=exemplar_text,
-                output_dir=None,  # Don't save per-candidate artifacts automatically
-            )
-
-            # Prepare draft dict for evaluation
-            draft = {
-                "text": draft_result.get("repaired", draft_result.get("stitched", "")),
-                "seeds": draft_result.get("metadata", {}).get("seeds", {}),
-            }
-
-            # Evaluate draft
-            report = evaluate_draft(
-                draft=draft,
-                spec=spec,
-                digest=digest,
-                exemplar_text=exemplar_text,
-                config=config,
-                run_id=self.run_id,
-                candidate_id=candidate_id,
-                use_llm_stylefit=False,  # Use heuristics only for optimization
+        # Candidates are independent, so generate and evaluate them concurrently;
+        # map keeps them in index order
+        with ThreadPoolExecutor(max_workers=self.candidates) as executor:
+            candidates = list(
+                executor.map(
+                    lambda i: self._generate_candidate(
+                        iteration=iteration,
+                        index=i,
+                        spec=spec,
+                        config=config,
+                        digest=digest,
+                        exemplar_text=exemplar_text,
+                        output_dir=output_dir,
+                    ),
+                    range(self.candidates),
+                )
             )
 
-            candidates.append({"draft": draft, "report": report, "spec": spec})
-
-            # Save iteration artifacts
-            iter_dir = Path(output_dir) / self.run_id / f"iter_{iteration}"
-            iter_dir.mkdir(parents=True, exist_ok=True)
-
-            # Save draft
-            draft_path = iter_dir / f"draft_{i}.txt"
-            with open(draft_path, "w", encoding="utf-8") as f:
-                f.write(draft.get("text", ""))
-
-            # Save evaluation report
-            save_eval_report(report, output_dir=str(iter_dir.parent))
-
         # Find best candidate in this iteration
         best_candidate = max(candidates, key=lambda c: c["report"].scores.overall)
 
@@ -329,6 +316,80 @@ class Optimizer:
             "all_scores": [c["report"].scores.overall for c in candidates],
         }
 
+    @staticmethod
+    def _copy_adjustable(spec: StorySpec) -> StorySpec:
+        """
+        Copy the parts of a spec that suggest() adjusts in place.
+
+        voice.syntax, form (dialogue_ratio) and each beat in form.beat_map get
+        fresh copies; unchanged subtrees such as content and constraints are
+        shared with the original, avoiding a full deep copy per iteration.
+
+        Args:
+            spec: StorySpec to copy
+
+        Returns:
+            StorySpec safe to adjust without affecting the original
+        """
+        new_spec = spec.model_copy()
+        new_spec.voice = spec.voice.model_copy(update={"syntax": spec.voice.syntax.model_copy()})
+        new_spec.form = spec.form.model_copy(
+            update={"beat_map": [beat.model_copy() for beat in spec.form.beat_map]}
+        )
+        return new_spec
+
+    def _generate_candidate(
+        self,
+        iteration: int,
+        index: int,
+        spec: StorySpec,
+        config: GenerationConfig,
+        digest: ExemplarDigest,
+        exemplar_text: str,
+        output_dir: str,
+    ) -> dict[str, Any]:
+        """Generate, evaluate, and save a single candidate for an iteration."""
+        candidate_id = f"{self.run_id}_iter{iteration}_cand{index}"
+
+        # Generate draft using run_draft_generation
+        draft_result = run_draft_generation(
+            spec=spec,
+            exemplar=exemplar_text,
+            output_dir=None,  # Don't save per-candidate artifacts automatically
+        )
+
+        # Prepare draft dict for evaluation
+        draft = {
+            "text": draft_result.get("repaired", draft_result.get("stitched", "")),
+            "seeds": draft_result.get("metadata", {}).get("seeds", {}),
+        }
+
+        # Evaluate draft
+        report = evaluate_draft(
+            draft=draft,
+            spec=spec,
+            digest=digest,
+            exemplar_text=exemplar_text,
+            config=config,
+            run_id=self.run_id,
+            candidate_id=candidate_id,
+            use_llm_stylefit=False,  # Use heuristics only for optimization
+        )
+
+        # Save iteration artifacts
+        iter_dir = Path(output_dir) / self.run_id / f"iter_{iteration}"
+        iter_dir.mkdir(parents=True, exist_ok=True)
+
+        # Save draft
+        draft_path = iter_dir / f"draft_{index}.txt"
+        with open(draft_path, "w", encoding="utf-8") as f:
+            f.write(draft.get("text", ""))
+
+        # Save evaluation report
+        save_eval_report(report, output_dir=str(iter_dir.parent))
+
+        return {"draft": draft, "report": report, "spec": spec}
+
     def _apply_suggestion(self, spec: StorySpec, suggestion: TuningSuggestion) -> None:
         """Apply a tuning suggestion to the spec."""
         param = suggestion.param
@@ -363,15 +424,20 @@ class Optimizer:
 
     def _adjust_beat_lengths(self, spec: StorySpec, report: EvalReport) -> None:
         """Adjust beat target_words based on formfit feedback."""
+        # Index beats by id once instead of rescanning the beat map per score
+        beats_by_id: dict[str, list[BeatSpec]] = {}
+        for beat in spec.form.beat_map:
+            beats_by_id.setdefault(beat.id, []).append(beat)
+
         # Find beats that are too short or too long based on per-beat scores
         for beat_score in report.per_beat:
-            # Find corresponding beat in spec
-            for beat in spec.form.beat_map:
-                if beat.id == beat_score.id and beat_score.formfit < 0.7:
-                    # If formfit is low, adjust target words slightly (5-10%)
-                    adjustment = int(beat.target_words * 0.08)
-                    beat.target_words += adjustment if beat_score.formfit < 0.5 else -adjustment
-                    beat.target_words = max(50, min(300, beat.target_words))
+            if beat_score.formfit >= 0.7:
+                continue
+            for beat in beats_by_id.get(beat_score.id, ()):
+                # If formfit is low, adjust target words slightly (5-10%)
+                adjustment = int(beat.target_words * 0.08)
+                beat.target_words += adjustment if beat_score.formfit < 0.5 else -adjustment
+                beat.target_words = max(50, min(300, beat.target_words))
 
     def _adjust_syntax(self, spec: StorySpec, report: EvalReport) -> None:
         """Adjust syntax parameters based on stylefit feedback."""
@@ -422,6 +488,19 @@ class Optimizer:
 
         return new_config
 
+    def _append_history(self, iteration_result: dict[str, Any], output_dir: str) -> None:
+        """Append one iteration's scores to the run's history.jsonl."""
+        run_dir = Path(output_dir) / self.run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        record = {
+            "iteration": iteration_result["iteration"],
+            "best_score": iteration_result["best_score"],
+            "all_scores": iteration_result["all_scores"],
+        }
+        with open(run_dir / "history.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
     def _save_final_results(
         self,
         best_spec: StorySpec,
@@ -438,7 +517,7 @@ class Optimizer:
         # Save best spec
         spec_path = results_dir / "best_spec.json"
         with open(spec_path, "w", encoding="utf-8") as f:
-            json.dump(best_spec.model_dump(by_alias=True), f, indent=2)
+            f.write(best_spec.model_dump_json(indent=2, by_alias=True))
 
         # Save best draft
         if best_draft:
@@ -450,7 +529,7 @@ class Optimizer:
         if best_report:
             report_path = results_dir / "best_report.json"
             with open(report_path, "w", encoding="utf-8") as f:
-                json.dump(best_report.model_dump(by_alias=True), f, indent=2)
+                f.write(best_report.model_dump_json(indent=2, by_alias=True))
 
         # Save optimization summary
         summary = {
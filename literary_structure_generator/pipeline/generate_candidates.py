@@ -14,13 +14,18 @@ All LLM calls go through the router, with GPT-5 parameter handling.
 """
 
 import hashlib
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
 
 from literary_structure_generator.evaluators.evaluate import evaluate_draft
 from literary_structure_generator.generation.draft_generator import (
-    generate_beat_text,
+    generate_beat_sets,
+    generate_beats,
     stitch_beats,
 )
 from literary_structure_generator.generation.guards import check_overlap_guard
@@ -38,6 +43,7 @@ def generate_single_candidate(
     run_id: str,
     config: GenerationConfig | None = None,
     skip_repair: bool = False,
+    beat_results: list[dict] | None = None,
 ) -> dict:
     """
     Generate a single candidate draft.
@@ -57,6 +63,7 @@ def generate_single_candidate(
         run_id: Run identifier
         config: Optional GenerationConfig (uses default if not provided)
         skip_repair: If True, skip the repair pass (for finalists-only mode)
+        beat_results: Optional pre-generated beat results (generated here if omitted)
 
     Returns:
         Dictionary with:
@@ -70,25 +77,9 @@ def generate_single_candidate(
     if config is None:
         config = GenerationConfig()
 
-    beat_results = []
-    beat_texts = []
-    memory = {}
-
-    for beat_spec in spec.form.beat_map:
-        beat_result = generate_beat_text(
-            beat_spec=beat_spec,
-            story_spec=spec,
-            memory=memory,
-            exemplar=exemplar_text,
-            max_retries=2,
-        )
-        beat_results.append(beat_result)
-        beat_texts.append(beat_result["text"])
-
-        memory[beat_spec.id] = {
-            "text": beat_result["text"],
-            "function": beat_spec.function,
-        }
+    if beat_results is None:
+        beat_results = generate_beats(spec, exemplar=exemplar_text, max_retries=2)
+    beat_texts = [beat_result["text"] for beat_result in beat_results]
 
     stitched = stitch_beats(beat_texts)
 
@@ -159,6 +150,63 @@ def generate_single_candidate(
     }
 
 
+def _dump_json(obj: Any) -> str:
+    """
+    Serialize plain JSON data with pydantic-core's native encoder.
+
+    Equivalent to json.dumps(obj, indent=2, default=str) for the plain
+    dict/list/scalar data written here, except that non-ASCII text is
+    written as UTF-8 rather than escaped, like model_dump_json.
+
+    Args:
+        obj: JSON-compatible data
+
+    Returns:
+        Indented JSON string
+    """
+    return to_json(obj, indent=2, fallback=str, inf_nan_mode="constants").decode("utf-8")
+
+
+def _atomic_write(path: Path, data: str) -> None:
+    """
+    Write text to a file via a temporary sibling and an atomic rename.
+
+    Args:
+        path: Destination file path
+        data: Text content
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _persist_candidate(candidate_dir: Path, candidate: dict) -> None:
+    """
+    Serialize and write one candidate's artifacts.
+
+    Args:
+        candidate_dir: Directory for this candidate's files
+        candidate: Candidate dictionary from generate_single_candidate
+    """
+    candidate_dir.mkdir(exist_ok=True)
+
+    _atomic_write(candidate_dir / "repaired.txt", candidate["repaired"])
+    _atomic_write(candidate_dir / "stitched.txt", candidate["stitched"])
+    _atomic_write(
+        candidate_dir / "beat_results.json",
+        _dump_json(candidate["beats"]),
+    )
+    _atomic_write(
+        candidate_dir / "eval_report.json",
+        candidate["eval"].model_dump_json(indent=2, by_alias=True),
+    )
+    _atomic_write(
+        candidate_dir / "metadata.json",
+        _dump_json(candidate["metadata"]),
+    )
+
+
 def select_best_candidate(candidates: list[dict]) -> str:
     """
     Select the best candidate based on evaluation scores.
@@ -177,17 +225,17 @@ def select_best_candidate(candidates: list[dict]) -> str:
     if not candidates:
         raise ValueError("No candidates to select from")
 
-    sorted_candidates = sorted(
+    # max() returns the first maximal candidate, matching a stable descending sort
+    best = max(
         candidates,
         key=lambda c: (
             c["eval"].pass_fail,
             c["eval"].scores.overall,
             c["eval"].scores.freshness,
         ),
-        reverse=True,
     )
 
-    return sorted_candidates[0]["id"]
+    return best["id"]
 
 
 def generate_candidates(
@@ -199,6 +247,7 @@ def generate_candidates(
     run_id: str | None = None,
     config: GenerationConfig | None = None,
     output_dir: str = "runs",
+    max_workers: int = 4,
 ) -> dict:
     """
     Generate N candidate drafts, evaluate them, and select the best.
@@ -217,6 +266,7 @@ def generate_candidates(
         run_id: Optional run identifier (auto-generated if not provided)
         config: Optional GenerationConfig. If omitted, a default config is used.
         output_dir: Base output directory for persisted run artifacts.
+        max_workers: Maximum number of candidates generated concurrently (default: 4)
 
     Returns:
         Dictionary with:
@@ -245,21 +295,30 @@ def generate_candidates(
     finalists_only = repair_params.get("finalists_only", None)
     use_finalists_mode = finalists_only is not None and finalists_only > 0
 
-    candidates = []
-    for i in range(n_candidates):
-        candidate_id = f"cand_{i + 1:03d}"
-
-        candidate = generate_single_candidate(
-            spec=spec,
-            digest=digest,
-            exemplar_text=exemplar_text,
-            candidate_id=candidate_id,
-            run_id=run_id,
-            config=config,
-            skip_repair=use_finalists_mode,
-        )
+    # All candidates share the same beat prompts, so request each beat once
+    # for all of them
+    beat_sets = generate_beat_sets(
+        spec, n_candidates, exemplar=exemplar_text, max_retries=2, max_workers=max_workers
+    )
 
-        candidates.append(candidate)
+    # Candidates are independent, so their repair and evaluation can overlap;
+    # map keeps candidates in id order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        candidates = list(
+            executor.map(
+                lambda i: generate_single_candidate(
+                    spec=spec,
+                    digest=digest,
+                    exemplar_text=exemplar_text,
+                    candidate_id=f"cand_{i + 1:03d}",
+                    run_id=run_id,
+                    config=config,
+                    skip_repair=use_finalists_mode,
+                    beat_results=beat_sets[i],
+                ),
+                range(n_candidates),
+            )
+        )
 
     if use_finalists_mode:
         sorted_candidates = sorted(
@@ -344,28 +403,6 @@ def generate_candidates(
     output_path = Path(output_dir) / run_id
     output_path.mkdir(parents=True, exist_ok=True)
 
-    for candidate in candidates:
-        candidate_dir = output_path / candidate["id"]
-        candidate_dir.mkdir(exist_ok=True)
-
-        with open(candidate_dir / "repaired.txt", "w", encoding="utf-8") as f:
-            f.write(candidate["repaired"])
-
-        with open(candidate_dir / "stitched.txt", "w", encoding="utf-8") as f:
-            f.write(candidate["stitched"])
-
-        with open(candidate_dir / "beat_results.json", "w", encoding="utf-8") as f:
-            json.dump(candidate["beats"], f, indent=2, default=str)
-
-        with open(candidate_dir / "eval_report.json", "w", encoding="utf-8") as f:
-            f.write(candidate["eval"].model_dump_json(indent=2, by_alias=True))
-
-        with open(candidate_dir / "metadata.json", "w", encoding="utf-8") as f:
-            json.dump(candidate["metadata"], f, indent=2, default=str)
-
-    with open(output_path / "run_metadata.json", "w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2, default=str)
-
     summary = {
         "run_id": run_id,
         "best_candidate": best_id,
@@ -379,8 +416,26 @@ def generate_candidates(
             for c in candidates
         ],
     }
-    with open(output_path / "summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+
+    # Serialize and write candidates in parallel; leaving the block waits for
+    # every write, and result() re-raises any I/O error
+    with ThreadPoolExecutor(max_workers=max_workers) as writer:
+        futures = [
+            writer.submit(_persist_candidate, output_path / candidate["id"], candidate)
+            for candidate in candidates
+        ]
+        futures.append(
+            writer.submit(
+                _atomic_write,
+                output_path / "run_metadata.json",
+                _dump_json(meta),
+            )
+        )
+        futures.append(
+            writer.submit(_atomic_write, output_path / "summary.json", _dump_json(summary))
+        )
+    for future in futures:
+        future.result()
 
     return {
         "candidates": candidates,
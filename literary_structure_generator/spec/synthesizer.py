@@ -527,7 +527,7 @@ def synthesize_spec(
         anti_plagiarism=AntiPlagiarism(
             max_ngram=12,
             overlap_pct=0.03,
-            simhash_hamming_min=18,
+            simhash_hamming_min=36,
         ),
         length_words=LengthConstraints(
             min=round(target_words * 0.8),
@@ -5,15 +5,24 @@ Utility for logging agent decisions across workflow runs.
 Provides a simple log_decision() function that can be called from any agent
 without circular imports.
 
-Each decision is saved as a ReasonLog JSON file in the /runs/{run_id}/iter_{iteration}/ directory.
+Each decision is appended as one ReasonLog JSON line to a per-agent file in the
+/runs/{run_id}/iter_{iteration}/reason_logs/ directory.
 """
 
-import json
+import threading
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from literary_structure_generator.models.reason_log import ReasonLog
 
+# Serializes appends so concurrent agents never interleave partial lines
+_WRITE_LOCK = threading.Lock()
+
+# Validates every matching log line in one call instead of one call per line
+_REASON_LOG_LIST = TypeAdapter(list[ReasonLog])
+
 
 def log_decision(
     run_id: str,
@@ -27,10 +36,10 @@ def log_decision(
     output_dir: str = "runs",
 ) -> ReasonLog:
     """
-    Log an agent decision to a ReasonLog JSON file.
+    Log an agent decision to the agent's ReasonLog JSON Lines file.
 
-    Creates a timestamped decision log entry and saves it to:
-    {output_dir}/{run_id}/iter_{iteration}/reason_logs/{agent}_{timestamp}.json
+    Creates a timestamped decision log entry and appends it to:
+    {output_dir}/{run_id}/iter_{iteration}/reason_logs/{agent}.jsonl
 
     Args:
         run_id: Unique run identifier
@@ -73,14 +82,12 @@ def log_decision(
     log_dir = Path(output_dir) / run_id / f"iter_{iteration}" / "reason_logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate filename with timestamp
-    timestamp = reason_log.timestamp.replace(":", "-").replace(".", "-")
-    filename = f"{agent}_{timestamp}.json"
-    filepath = log_dir / filename
+    # One file per agent per iteration; each decision is a single line
+    filepath = log_dir / f"{agent}.jsonl"
+    line = reason_log.model_dump_json(by_alias=True) + "\n"
 
-    # Save to JSON file
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(reason_log.model_dump(by_alias=True), f, indent=2)
+    with _WRITE_LOCK, open(filepath, "a", encoding="utf-8") as f:
+        f.write(line)
 
     return reason_log
 
@@ -107,11 +114,10 @@ def load_decision_logs(
         >>> logs = load_decision_logs("run_001", iteration=0)
         >>> logs = load_decision_logs("run_001", agent="Evaluator")
     """
-    logs = []
     run_dir = Path(output_dir) / run_id
 
     if not run_dir.exists():
-        return logs
+        return []
 
     # Determine which iteration directories to search
     if iteration is not None:
@@ -119,22 +125,25 @@ def load_decision_logs(
     else:
         iter_dirs = sorted(run_dir.glob("iter_*"))
 
-    # Load logs from each iteration directory
+    # Collect raw log lines from each iteration directory
+    lines: list[bytes] = []
     for iter_dir in iter_dirs:
         log_dir = iter_dir / "reason_logs"
         if not log_dir.exists():
             continue
 
-        # Find matching log files
+        # Find matching log files; an agent's file has a fixed name, so probe it directly
         if agent is not None:
-            log_files = sorted(log_dir.glob(f"{agent}_*.json"))
+            agent_file = log_dir / f"{agent}.jsonl"
+            log_files = [agent_file] if agent_file.is_file() else []
         else:
-            log_files = sorted(log_dir.glob("*.json"))
+            log_files = sorted(log_dir.glob("*.jsonl"))
 
-        # Load each log file
+        # Keep each logged decision in the order it was appended
         for log_file in log_files:
-            with open(log_file, encoding="utf-8") as f:
-                data = json.load(f)
-                logs.append(ReasonLog(**data))
+            lines.extend(line for line in log_file.read_bytes().splitlines() if line.strip())
+
+    if not lines:
+        return []
 
-    return logs
+    return _REASON_LOG_LIST.validate_json(b"[" + b",".join(lines) + b"]")
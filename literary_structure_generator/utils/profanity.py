@@ -7,8 +7,8 @@ detected profanity with [bleep] while preserving rhythm and tone.
 
 import re
 
-# Comprehensive profanity list for filtering
-PROFANITY_LIST = [
+# Comprehensive profanity list for filtering (immutable; the matcher is built from it at import)
+PROFANITY_LIST: tuple[str, ...] = (
     "fuck",
     "fucking",
     "fucked",
@@ -26,7 +26,81 @@ PROFANITY_LIST = [
     "hell",
     "ass",
     "crap",
-]
+)
+
+
+def _trie_to_regex(node: dict[str, dict]) -> str:
+    """
+    Render a character trie as a regex with shared prefixes factored out.
+
+    Args:
+        node: Trie node mapping characters to child nodes ("" marks a word end)
+
+    Returns:
+        Regex source matching exactly the words stored under this node
+    """
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+def _build_profanity_pattern(words: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Build a single matcher for all profanity words.
+
+    Words are stored in a trie so shared prefixes ("fuck", "fucking",
+    "fucked", ...) are matched once instead of retried per alternative.
+
+    Args:
+        words: Profanity words to match
+
+    Returns:
+        Compiled case-insensitive pattern with word boundaries
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return re.compile(r"\b" + _trie_to_regex(trie) + r"\b", re.IGNORECASE)
+
+
+# Compiled once at import; every filter call is a single regex pass
+_PROFANITY_RE = _build_profanity_pattern(PROFANITY_LIST)
+
+# Words that contain no shorter listed word; any match contains one of them
+_PREFILTER_ROOTS = tuple(
+    word for word in PROFANITY_LIST if not any(o != word and o in word for o in PROFANITY_LIST)
+)
+
+# Letters re.IGNORECASE matches to ASCII that str.lower() leaves alone
+_CASE_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _may_contain_profanity(text: str) -> bool:
+    """
+    Cheaply rule out text that cannot match the profanity pattern.
+
+    Substring checks on a lowercased copy run much faster than the regex,
+    so clean text skips the regex scan entirely.
+
+    Args:
+        text: Input text
+
+    Returns:
+        False only if the text certainly contains no profanity
+    """
+    folded = text.translate(_CASE_FOLD_TABLE).lower()
+    return any(root in folded for root in _PREFILTER_ROOTS)
 
 
 def structural_bleep(text: str, substitution: str = "[bleep]") -> str:
@@ -52,18 +126,11 @@ def structural_bleep(text: str, substitution: str = "[bleep]") -> str:
         >>> structural_bleep("assessment", "[bleep]")
         'assessment'  # Not affected - contains "ass" but not as word
     """
-    if not text:
+    if not text or not _may_contain_profanity(text):
         return text
 
-    # Build regex pattern with word boundaries
-    # Case-insensitive matching to catch all variations
-    pattern = re.compile(
-        r"\b(" + "|".join(re.escape(word) for word in PROFANITY_LIST) + r")\b",
-        re.IGNORECASE,
-    )
-
     # Replace with substitution
-    return pattern.sub(substitution, text)
+    return _PROFANITY_RE.sub(substitution, text)
 
 
 def count_bleeps(text: str) -> int:
@@ -76,17 +143,31 @@ def count_bleeps(text: str) -> int:
     Returns:
         Number of profanity instances found
     """
-    if not text:
+    if not text or not _may_contain_profanity(text):
         return 0
 
-    pattern = re.compile(
-        r"\b(" + "|".join(re.escape(word) for word in PROFANITY_LIST) + r")\b",
-        re.IGNORECASE,
-    )
-    matches = pattern.findall(text)
+    matches = _PROFANITY_RE.findall(text)
     return len(matches)
 
 
+def contains_profanity(text: str) -> bool:
+    """
+    Check whether text contains any profanity.
+
+    Stops at the first match instead of counting every instance.
+
+    Args:
+        text: Input text to analyze
+
+    Returns:
+        True if at least one profanity instance is found
+    """
+    if not text or not _may_contain_profanity(text):
+        return False
+
+    return _PROFANITY_RE.search(text) is not None
+
+
 def apply_profanity_filter(
     text: str,
     enabled: bool = True,
@@ -109,7 +190,11 @@ def apply_profanity_filter(
     if not enabled:
         return text, None
 
-    count = count_bleeps(text) if log_replacements else None
-    filtered = structural_bleep(text, substitution)
+    if not log_replacements:
+        return structural_bleep(text, substitution), None
+
+    if not text or not _may_contain_profanity(text):
+        return text, 0
 
-    return filtered, count
+    # Substitute and count in a single pass
+    return _PROFANITY_RE.subn(substitution, text)
@@ -12,6 +12,31 @@ Features:
 
 import hashlib
 import re
+from collections import Counter
+
+import numpy as np
+
+
+def _accumulate_bit_counters(hashes: list[int], weights: list[int], num_bits: int) -> np.ndarray:
+    """
+    Accumulate weighted +1/-1 SimHash votes for every bit position.
+
+    Unpacks all token hashes into a (tokens x bits) matrix and reduces it in
+    a single vectorized pass instead of a Python loop per token and bit.
+
+    Args:
+        hashes: Token hash values
+        weights: Occurrence count for each hash
+        num_bits: Number of bits in fingerprint
+
+    Returns:
+        Array of per-bit counters
+    """
+    width = max((num_bits + 7) // 8, max(h.bit_length() for h in hashes) // 8 + 1)
+    raw = b"".join(h.to_bytes(width, "little") for h in hashes)
+    matrix = np.frombuffer(raw, dtype=np.uint8).reshape(len(hashes), width)
+    bits = np.unpackbits(matrix, axis=1, count=num_bits, bitorder="little").astype(np.int64)
+    return np.asarray(weights, dtype=np.int64) @ (2 * bits - 1)
 
 
 def calculate_simhash(text: str, num_bits: int = 256) -> int:
@@ -33,28 +58,20 @@ def calculate_simhash(text: str, num_bits: int = 256) -> int:
     if not words:
         return 0
 
-    # Initialize bit vector
-    v = [0] * num_bits
-
-    # Process each word
-    for word in words:
-        # Hash the word (using MD5 for SimHash - not for security)
-        h = int(hashlib.md5(word.encode()).hexdigest(), 16)  # noqa: S324
-
-        # Update bit vector
-        for i in range(num_bits):
-            if h & (1 << i):
-                v[i] += 1
-            else:
-                v[i] -= 1
+    # Hash each distinct word once; repeats contribute through their count.
+    # BLAKE2b digests are sized to the fingerprint so every bit gets a vote.
+    word_counts = Counter(words)
+    digest_size = min(max((num_bits + 7) // 8, 1), 64)
+    hashes = [
+        int.from_bytes(hashlib.blake2b(word.encode(), digest_size=digest_size).digest(), "little")
+        for word in word_counts
+    ]
 
-    # Generate fingerprint
-    fingerprint = 0
-    for i in range(num_bits):
-        if v[i] > 0:
-            fingerprint |= 1 << i
+    # Build bit vector
+    v = _accumulate_bit_counters(hashes, list(word_counts.values()), num_bits)
 
-    return fingerprint
+    # Generate fingerprint: pack the positive counters into bytes, bit i -> 1 << i
+    return int.from_bytes(np.packbits(v > 0, bitorder="little").tobytes(), "little")
 
 
 def hamming_distance(hash1: int, hash2: int) -> int:
@@ -69,12 +86,7 @@ def hamming_distance(hash1: int, hash2: int) -> int:
         Hamming distance (number of differing bits)
     """
     # XOR to find differing bits, then count them
-    xor = hash1 ^ hash2
-    distance = 0
-    while xor:
-        distance += xor & 1
-        xor >>= 1
-    return distance
+    return (hash1 ^ hash2).bit_count()
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -10,6 +10,8 @@ Features:
     - Word counting
 """
 
+from functools import lru_cache
+
 
 def tokenize_words(text: str) -> list[str]:
     """
@@ -39,6 +41,21 @@ def tokenize_sentences(text: str) -> list[str]:
     raise NotImplementedError("Sentence tokenization not yet implemented")
 
 
+@lru_cache(maxsize=16)
+def _split_paragraphs(text: str) -> tuple[str, ...]:
+    """
+    Split text on blank lines, cached so evaluators share one split per draft.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of stripped, non-empty paragraphs
+    """
+    # Longer newline runs leave only whitespace pieces, which are dropped
+    return tuple(p.strip() for p in text.split("\n\n") if p.strip())
+
+
 def tokenize_paragraphs(text: str) -> list[str]:
     """
     Tokenize text into paragraphs.
@@ -49,8 +66,34 @@ def tokenize_paragraphs(text: str) -> list[str]:
     Returns:
         List of paragraph strings
     """
-    # TODO: Implement paragraph tokenization
-    raise NotImplementedError("Paragraph tokenization not yet implemented")
+    return list(_split_paragraphs(text))
+
+
+@lru_cache(maxsize=16)
+def _paragraph_word_counts(text: str) -> tuple[int, ...]:
+    """
+    Count words per paragraph, cached alongside the paragraph split.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of word counts, one per paragraph
+    """
+    return tuple(len(p.split()) for p in _split_paragraphs(text))
+
+
+def paragraph_word_counts(text: str) -> list[int]:
+    """
+    Count words in each paragraph of text.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of word counts, one per paragraph from tokenize_paragraphs
+    """
+    return list(_paragraph_word_counts(text))
 
 
 def extract_ngrams(text: str, n: int) -> set[str]:
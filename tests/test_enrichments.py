@@ -11,6 +11,7 @@ from literary_structure_generator.digest.entity_extractor import (
     _detect_capitalized_spans,
     _levenshtein_distance,
     _resolve_aliases,
+    _within_one_edit,
     extract_entities,
 )
 from literary_structure_generator.digest.motif_extractor import (
@@ -70,6 +71,15 @@ class TestEntityExtraction:
         assert _levenshtein_distance("abc", "abc") == 0
         assert _levenshtein_distance("abc", "def") == 3
 
+    def test_within_one_edit(self):
+        """Test bounded edit check agrees with Levenshtein distance <= 1."""
+        assert _within_one_edit("jon", "john")
+        assert _within_one_edit("mary", "mory")
+        assert _within_one_edit("", "a")
+        assert not _within_one_edit("kitten", "sitting")
+        assert not _within_one_edit("ab", "ba")
+        assert not _within_one_edit("al", "alex")
+
     def test_resolve_aliases_exact_match(self):
         """Test alias resolution with exact matches."""
         candidates = [
@@ -66,6 +66,19 @@ class TestMockClient:
         assert "total_tokens" in usage
         assert usage["total_tokens"] > 0
 
+    def test_mock_client_complete_n(self):
+        """Test complete_n returns n completions for one prompt."""
+        client = MockClient()
+        prompt = "Generate prose for this beat\n**Target words:** 40"
+        responses = client.complete_n(prompt, 3)
+        batch_usage = dict(client.get_usage())
+        assert len(responses) == 3
+        assert all(response == client.complete(prompt) for response in responses)
+
+        # Usage after complete_n covers all n completions
+        single_usage = client.get_usage()
+        assert batch_usage == {key: 3 * value for key, value in single_usage.items()}
+
 
 class TestRouter:
     """Test LLM router configuration."""
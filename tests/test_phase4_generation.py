@@ -10,12 +10,15 @@ Tests cover:
 - Routing with GPT-5
 """
 
-import tempfile
-from pathlib import Path
+import random
+
+import pytest
 
 from literary_structure_generator.generation.draft_generator import (
     build_beat_prompt,
+    generate_beat_sets,
     generate_beat_text,
+    generate_beats,
     run_draft_generation,
     stitch_beats,
 )
@@ -68,6 +71,13 @@ class TestSimilarityUtils:
         hash2 = calculate_simhash(text2)
         assert hash1 == hash2
 
+    def test_simhash_uses_full_width(self):
+        """Test SimHash sets bits across the whole fingerprint width."""
+        text = "The quick brown fox jumps over the lazy dog"
+        hash_val = calculate_simhash(text, num_bits=256)
+        assert hash_val >> 128 != 0
+        assert hash_val.bit_length() <= 256
+
     def test_hamming_distance_identical(self):
         """Test Hamming distance of identical hashes."""
         hash1 = 12345
@@ -162,6 +172,19 @@ class TestGuards:
         assert not result["passed"]
         assert any("overlap" in v.lower() for v in result["violations"])
 
+    def test_check_overlap_guard_ngram_gate(self):
+        """Test overlap guard skipping n-gram check for distant texts."""
+        text1 = "The protagonist walked down the street on a sunny day."
+        text2 = "A character strolled along the avenue under cloudy skies."
+        result = check_overlap_guard(text1, text2, ngram_gate_distance=0)
+        assert result["passed"]
+        assert result["ngram_overlap"] is None
+
+        # Near-duplicates fall under the gate and still get the n-gram check
+        result = check_overlap_guard(text1, text1, ngram_gate_distance=256)
+        assert result["ngram_overlap"] == 1.0
+        assert not result["passed"]
+
     def test_apply_clean_mode_if_needed_enabled(self):
         """Test clean mode application when enabled."""
         text = "What the hell"
@@ -198,29 +221,18 @@ class TestRepair:
         variance = calculate_paragraph_variance("")
         assert variance == 0.0
 
-    def test_repair_text_basic(self):
+    def test_repair_text_basic(self, minimal_spec):
         """Test basic repair pass."""
-        # Create minimal spec
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(setting=Setting(place="test", time="now")),
-        )
-
         text = "The protagonist walked down the street."
-        repaired = repair_text(text, spec)
+        repaired = repair_text(text, minimal_spec)
         assert isinstance(repaired, str)
         assert len(repaired) > 0
 
-    def test_repair_text_with_issues(self):
+    def test_repair_text_with_issues(self, minimal_spec):
         """Test repair pass with specific issues."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(setting=Setting(place="test", time="now")),
-        )
-
         text = "The protagonist walked down the street."
         notes = {"issues": ["Fix POV leak", "Improve rhythm"]}
-        repaired = repair_text(text, spec, notes=notes)
+        repaired = repair_text(text, minimal_spec, notes=notes)
         assert isinstance(repaired, str)
         assert len(repaired) > 0
 
@@ -267,7 +279,7 @@ class TestDraftGenerator:
         assert "Third beat" in stitched
         assert "\n\n" in stitched
 
-    def test_generate_beat_text_basic(self):
+    def test_generate_beat_text_basic(self, base_spec):
         """Test single beat generation."""
         beat = BeatSpec(
             id="beat1",
@@ -276,21 +288,13 @@ class TestDraftGenerator:
             cadence="mixed",
             summary="Start the story",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(
-                setting=Setting(place="City", time="present"),
-                characters=[Character(name="Alex", role="protagonist")],
-            ),
-        )
-
-        result = generate_beat_text(beat, spec)
+        result = generate_beat_text(beat, base_spec)
         assert "text" in result
         assert "metadata" in result
         assert isinstance(result["text"], str)
         assert len(result["text"]) > 0
 
-    def test_generate_beat_text_with_exemplar(self):
+    def test_generate_beat_text_with_exemplar(self, base_spec):
         """Test beat generation with overlap guard."""
         beat = BeatSpec(
             id="beat1",
@@ -298,27 +302,13 @@ class TestDraftGenerator:
             function="opening",
             cadence="mixed",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(
-                setting=Setting(place="City", time="present"),
-                characters=[Character(name="Alex", role="protagonist")],
-            ),
-        )
-
         exemplar = "Some exemplar text that should not be copied verbatim."
-        result = generate_beat_text(beat, spec, exemplar=exemplar)
+        result = generate_beat_text(beat, base_spec, exemplar=exemplar)
         assert result["guard_passed"]
 
-    def test_run_draft_generation_basic(self):
+    def test_run_draft_generation_basic(self, base_spec):
         """Test full draft generation pipeline."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_story", seed=137),
-            content=Content(
-                setting=Setting(place="City", time="present"),
-                characters=[Character(name="Alex", role="protagonist")],
-            ),
-        )
+        spec = base_spec.model_copy(deep=True)
 
         # Add beats to spec
         spec.form.beat_map = [
@@ -344,16 +334,75 @@ class TestDraftGenerator:
         assert "metadata" in result
         assert len(result["beats"]) == 2
 
-    def test_run_draft_generation_with_output(self):
-        """Test draft generation with file output."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_story", seed=137),
-            content=Content(
-                setting=Setting(place="City", time="present"),
-                characters=[Character(name="Alex", role="protagonist")],
-            ),
+    def test_run_draft_generation_concurrent_matches_sequential(self, base_spec):
+        """Test concurrent beat generation keeps beat order and output."""
+        spec = base_spec.model_copy(deep=True)
+        spec.form.beat_map = [
+            BeatSpec(id=f"beat{i}", target_words=50 + i, function=f"step {i}", cadence="mixed")
+            for i in range(6)
+        ]
+
+        sequential = run_draft_generation(spec, max_workers=1)
+        concurrent = run_draft_generation(spec, max_workers=4)
+        assert [b["text"] for b in concurrent["beats"]] == [b["text"] for b in sequential["beats"]]
+        assert concurrent["stitched"] == sequential["stitched"]
+
+    def test_generate_beat_sets_shape(self, base_spec):
+        """Test batched beat generation returns one beat list per set."""
+        spec = base_spec.model_copy(deep=True)
+        spec.form.beat_map = [
+            BeatSpec(id=f"beat{i}", target_words=50 + i, function=f"step {i}", cadence="mixed")
+            for i in range(3)
+        ]
+
+        beat_sets = generate_beat_sets(spec, 2)
+        assert len(beat_sets) == 2
+        for beats in beat_sets:
+            assert len(beats) == 3
+            assert all(beat["text"] for beat in beats)
+
+    def test_generate_beat_sets_one_client_per_position(self, base_spec, monkeypatch):
+        """Test prefetched beats that pass the guard create no extra clients."""
+        spec = base_spec.model_copy(deep=True)
+        spec.form.beat_map = [
+            BeatSpec(id=f"beat{i}", target_words=50 + i, function=f"step {i}", cadence="mixed")
+            for i in range(3)
+        ]
+
+        calls = []
+
+        def counting_get_client(component):
+            calls.append(component)
+            return get_client(component)
+
+        monkeypatch.setattr(
+            "literary_structure_generator.generation.draft_generator.get_client",
+            counting_get_client,
         )
 
+        beat_sets = generate_beat_sets(spec, 4)
+        assert len(calls) == len(spec.form.beat_map)
+        assert all(beat["metadata"]["model"] == "mock" for beats in beat_sets for beat in beats)
+
+    def test_generate_beat_sets_records_usage(self, base_spec):
+        """Test batched beats carry their share of the batch's token usage."""
+        spec = base_spec.model_copy(deep=True)
+        spec.form.beat_map = [
+            BeatSpec(id=f"beat{i}", target_words=50 + i, function=f"step {i}", cadence="mixed")
+            for i in range(3)
+        ]
+
+        # The mock samples every completion alike, so each share matches a single call
+        single = generate_beats(spec)
+        for beats in generate_beat_sets(spec, 3):
+            for beat, expected in zip(beats, single, strict=True):
+                assert beat["metadata"]["tokens"]["total_tokens"] > 0
+                assert beat["metadata"]["tokens"] == expected["metadata"]["tokens"]
+
+    def test_run_draft_generation_with_output(self, base_spec, tmp_path):
+        """Test draft generation with file output."""
+        spec = base_spec.model_copy(deep=True)
+
         spec.form.beat_map = [
             BeatSpec(
                 id="beat1",
@@ -363,17 +412,15 @@ class TestDraftGenerator:
             ),
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = run_draft_generation(spec, output_dir=tmpdir)
+        run_draft_generation(spec, output_dir=str(tmp_path))
 
-            # Check files created
-            output_path = Path(tmpdir)
-            assert (output_path / "story_spec.json").exists()
-            assert (output_path / "beat_results.json").exists()
-            assert (output_path / "stitched.txt").exists()
-            assert (output_path / "repaired.txt").exists()
-            assert (output_path / "final.txt").exists()
-            assert (output_path / "metadata.json").exists()
+        # Check files created
+        assert (tmp_path / "story_spec.json").exists()
+        assert (tmp_path / "beat_results.json").exists()
+        assert (tmp_path / "stitched.txt").exists()
+        assert (tmp_path / "repaired.txt").exists()
+        assert (tmp_path / "final.txt").exists()
+        assert (tmp_path / "metadata.json").exists()
 
 
 class TestRouterGPT5:
@@ -407,7 +454,7 @@ class TestEdgeCases:
         overlap = max_ngram_overlap("word", "word", n=12)
         assert overlap >= 0.0
 
-    def test_generate_beat_text_no_exemplar(self):
+    def test_generate_beat_text_no_exemplar(self, minimal_spec):
         """Test beat generation without exemplar."""
         beat = BeatSpec(
             id="beat1",
@@ -415,33 +462,18 @@ class TestEdgeCases:
             function="test",
             cadence="short",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="now"),
-            ),
-        )
-        result = generate_beat_text(beat, spec, exemplar=None)
+        result = generate_beat_text(beat, minimal_spec, exemplar=None)
         assert result["guard_passed"]
 
-    def test_repair_text_no_issues(self):
+    def test_repair_text_no_issues(self, minimal_spec):
         """Test repair with no issues."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(setting=Setting(place="test", time="now")),
-        )
         text = "Clean text."
-        repaired = repair_text(text, spec, notes=None)
+        repaired = repair_text(text, minimal_spec, notes=None)
         assert isinstance(repaired, str)
 
-    def test_run_draft_generation_with_exemplar(self):
+    def test_run_draft_generation_with_exemplar(self, minimal_spec):
         """Test draft generation with exemplar guard."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(
-                setting=Setting(place="City", time="present"),
-            ),
-        )
+        spec = minimal_spec.model_copy(deep=True)
         spec.form.beat_map = [
             BeatSpec(id="b1", target_words=50, function="test", cadence="short"),
         ]
@@ -462,7 +494,7 @@ class TestEdgeCases:
         distance = simhash_distance("", "")
         assert distance == 0
 
-    def test_build_beat_prompt_with_empty_lists(self):
+    def test_build_beat_prompt_with_empty_lists(self, minimal_spec):
         """Test beat prompt with minimal content."""
         beat = BeatSpec(
             id="beat1",
@@ -470,13 +502,7 @@ class TestEdgeCases:
             function="test",
             cadence="mixed",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="now"),
-            ),
-        )
-        prompt = build_beat_prompt(beat, spec)
+        prompt = build_beat_prompt(beat, minimal_spec)
         assert "test" in prompt.lower()
         assert "100" in prompt
 
@@ -488,7 +514,27 @@ class TestEdgeCases:
         result = check_overlap_guard(text1, text2, min_simhash_hamming=1)
         assert not result["passed"]
 
-    def test_generate_beat_text_with_memory(self):
+    def test_check_overlap_guard_simhash_catches_light_edits(self):
+        """Test default SimHash threshold rejects lightly edited copies on the 256-bit scale."""
+        rng = random.Random(42)  # noqa: S311
+        vocab = [f"word{i}" for i in range(500)]
+        exemplar = [rng.choice(vocab) for _ in range(300)]
+
+        for fraction in (0.05, 0.10):
+            edited = list(exemplar)
+            for i in rng.sample(range(len(edited)), int(len(edited) * fraction)):
+                edited[i] = rng.choice(vocab)
+
+            result = check_overlap_guard(" ".join(edited), " ".join(exemplar))
+            assert not result["passed"]
+            assert any(v.startswith("SimHash distance") for v in result["violations"])
+
+        # Unrelated text stays well clear of the threshold
+        unrelated = [rng.choice(vocab) for _ in range(300)]
+        result = check_overlap_guard(" ".join(unrelated), " ".join(exemplar))
+        assert result["passed"]
+
+    def test_generate_beat_text_with_memory(self, minimal_spec):
         """Test beat generation with context memory."""
         beat = BeatSpec(
             id="beat2",
@@ -496,15 +542,11 @@ class TestEdgeCases:
             function="continuation",
             cadence="short",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(setting=Setting(place="Test", time="now")),
-        )
         memory = {"beat1": {"text": "Previous beat text.", "function": "opening"}}
-        result = generate_beat_text(beat, spec, memory=memory)
+        result = generate_beat_text(beat, minimal_spec, memory=memory)
         assert "text" in result
 
-    def test_generate_beat_text_guard_failure(self):
+    def test_generate_beat_text_guard_failure(self, minimal_spec):
         """Test beat generation with guard failure."""
         beat = BeatSpec(
             id="beat1",
@@ -512,13 +554,9 @@ class TestEdgeCases:
             function="test",
             cadence="short",
         )
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test", seed=137),
-            content=Content(setting=Setting(place="Test", time="now")),
-        )
         # Use same text as exemplar to force high overlap
         exemplar = "The morning air carried the scent of rain."
-        result = generate_beat_text(beat, spec, exemplar=exemplar, max_retries=0)
+        result = generate_beat_text(beat, minimal_spec, exemplar=exemplar, max_retries=0)
         # Should still return result even if guard fails
         assert "text" in result
         assert "metadata" in result
@@ -560,3 +598,27 @@ class TestEdgeCases:
         assert "white walls" in prompt
         assert "stethoscope" in prompt
         assert "hypotactic" in prompt
+
+
+# Fixtures
+
+
+@pytest.fixture(scope="module")
+def base_spec():
+    """Create a StorySpec with a setting and one character, shared across the module."""
+    return StorySpec(
+        meta=MetaInfo(story_id="test", seed=137),
+        content=Content(
+            setting=Setting(place="City", time="present"),
+            characters=[Character(name="Alex", role="protagonist")],
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def minimal_spec():
+    """Create a StorySpec with only a setting, shared across the module."""
+    return StorySpec(
+        meta=MetaInfo(story_id="test", seed=137),
+        content=Content(setting=Setting(place="Test", time="now")),
+    )
@@ -29,6 +29,7 @@ from literary_structure_generator.evaluators.coherence_graph_fit import (
 )
 from literary_structure_generator.evaluators.evaluate import (
     evaluate_draft,
+    run_all_evaluators,
     save_eval_report,
 )
 from literary_structure_generator.evaluators.formfit import (
@@ -51,6 +52,7 @@ from literary_structure_generator.evaluators.overlap_guard_eval import (
     check_simhash_distance,
     evaluate_overlap_guard,
     find_max_ngram_overlap,
+    tokenize,
 )
 from literary_structure_generator.evaluators.stylefit_llm import (
     create_spec_summary,
@@ -86,6 +88,10 @@ from literary_structure_generator.models.story_spec import (
     StorySpec,
     Voice,
 )
+from literary_structure_generator.utils.text_utils import (
+    paragraph_word_counts,
+    tokenize_paragraphs,
+)
 
 
 # Sample texts for testing
@@ -182,17 +188,9 @@ class TestStylefitRules:
         clean = check_clean_mode(text)
         assert clean is False
 
-    def test_evaluate_stylefit_rules(self):
+    def test_evaluate_stylefit_rules(self, minimal_spec):
         """Test full stylefit_rules evaluation."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_001", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="Now"),
-                characters=[],
-            ),
-        )
-        
-        result = evaluate_stylefit_rules(SAMPLE_TEXT_FIRST_PERSON, spec)
+        result = evaluate_stylefit_rules(SAMPLE_TEXT_FIRST_PERSON, minimal_spec)
         
         assert 'overall' in result
         assert result['overall'] >= 0.0
@@ -407,6 +405,14 @@ class TestCadencePacing:
         assert len(lengths) > 0
         assert all(length > 0 for length in lengths)
 
+    def test_extract_paragraph_lengths_blank_line_runs(self):
+        """Test paragraph splitting ignores extra and whitespace-only lines."""
+        text = "one two\n\n\nthree\n\n  \n\nfour five six\n"
+        assert extract_paragraph_lengths(text) == [2, 1, 3]
+        assert tokenize_paragraphs(text) == ["one two", "three", "four five six"]
+        assert paragraph_word_counts(text) == [2, 1, 3]
+        assert sum(paragraph_word_counts(text)) == len(text.split())
+
     def test_classify_paragraph_cadence(self):
         """Test paragraph cadence classification."""
         lengths = [10, 50, 80, 20, 15]
@@ -475,6 +481,15 @@ class TestOverlapGuardEval:
         
         assert max_ngram >= 3  # "the quick brown"
 
+    def test_find_max_ngram_overlap_exact_length(self):
+        """Test n-gram overlap returns the exact shared run length."""
+        text1 = "one two three four five six seven eight nine"
+        text2 = "zero two three four five six seven ten"
+
+        assert find_max_ngram_overlap(text1, text2, max_n=20) == 6
+        assert find_max_ngram_overlap(text1, text2, max_n=4) == 4
+        assert find_max_ngram_overlap(text1, "", max_n=20) == 0
+
     def test_calculate_ngram_overlap_percentage(self):
         """Test n-gram overlap percentage."""
         text1 = "The quick brown fox."
@@ -494,6 +509,14 @@ class TestOverlapGuardEval:
         
         assert distance >= 0
 
+    def test_tokenize_returns_fresh_list(self):
+        """Test cached tokenization still hands callers their own list."""
+        tokens = tokenize("The quick, brown fox.")
+        assert tokens == ["the", "quick", "brown", "fox"]
+
+        tokens.append("extra")
+        assert tokenize("The quick, brown fox.") == ["the", "quick", "brown", "fox"]
+
     def test_evaluate_overlap_guard_pass(self):
         """Test overlap guard with different texts (should pass)."""
         text1 = "The quick brown fox jumps over the lazy dog."
@@ -521,17 +544,9 @@ class TestOverlapGuardEval:
 class TestStylefitLLM:
     """Test stylefit_llm evaluator."""
 
-    def test_create_spec_summary(self):
+    def test_create_spec_summary(self, minimal_spec):
         """Test spec summary creation."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_001", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="Now"),
-                characters=[],
-            ),
-        )
-        
-        summary = create_spec_summary(spec)
+        summary = create_spec_summary(minimal_spec)
         
         assert "Person:" in summary
         assert "Tense:" in summary
@@ -555,33 +570,17 @@ class TestStylefitLLM:
         score = parse_llm_score(response)
         assert score == 0.85
 
-    def test_evaluate_stylefit_llm_disabled(self):
+    def test_evaluate_stylefit_llm_disabled(self, minimal_spec):
         """Test stylefit LLM when disabled."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_001", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="Now"),
-                characters=[],
-            ),
-        )
-        
-        result = evaluate_stylefit_llm(SAMPLE_TEXT_FIRST_PERSON, spec, use_llm=False)
+        result = evaluate_stylefit_llm(SAMPLE_TEXT_FIRST_PERSON, minimal_spec, use_llm=False)
         
         assert result['enabled'] is False
         assert result['overall'] is None
 
-    def test_evaluate_stylefit_llm_with_mock(self):
+    def test_evaluate_stylefit_llm_with_mock(self, minimal_spec):
         """Test stylefit LLM with MockClient."""
-        spec = StorySpec(
-            meta=MetaInfo(story_id="test_001", seed=137),
-            content=Content(
-                setting=Setting(place="Test", time="Now"),
-                characters=[],
-            ),
-        )
-        
         # This should use MockClient which returns deterministic responses
-        result = evaluate_stylefit_llm(SAMPLE_TEXT_FIRST_PERSON, spec, use_llm=True)
+        result = evaluate_stylefit_llm(SAMPLE_TEXT_FIRST_PERSON, minimal_spec, use_llm=True)
         
         assert 'enabled' in result
         assert 'overall' in result
@@ -649,6 +648,33 @@ class TestEvaluateOrchestrator:
         assert len(report.per_beat) > 0
         assert report.pass_fail in [True, False]
 
+    def test_run_all_evaluators_without_llm_runs_inline(self, minimal_spec, monkeypatch):
+        """Test no worker thread is started when LLM stylefit is disabled."""
+
+        def no_executor(*_args, **_kwargs):
+            raise AssertionError("ThreadPoolExecutor should not be created")
+
+        monkeypatch.setattr(
+            "literary_structure_generator.evaluators.evaluate.ThreadPoolExecutor", no_executor
+        )
+        spec = minimal_spec.model_copy(deep=True)
+        spec.form.beat_map = [
+            BeatSpec(id="beat_1", target_words=30, function="hook", cadence="short"),
+        ]
+        digest = ExemplarDigest(meta=DigestMeta(source="test", tokens=100, paragraphs=5))
+
+        results = run_all_evaluators(
+            SAMPLE_TEXT_FIRST_PERSON,
+            spec,
+            digest,
+            "A completely different text.",
+            GenerationConfig(),
+            use_llm_stylefit=False,
+        )
+
+        assert "stylefit_llm" in results
+        assert "overlap_guard" in results
+
     def test_evaluate_draft_with_config(self):
         """Test evaluate_draft with custom config."""
         draft = {
@@ -883,3 +909,17 @@ Nothing could prepare her for what came next.
         json_str = report.model_dump_json(by_alias=True)
         assert 'schema' in json_str
         assert 'EvalReport@2' in json_str
+
+
+# Fixtures
+
+@pytest.fixture(scope="module")
+def minimal_spec():
+    """Create a minimal StorySpec shared across read-only tests."""
+    return StorySpec(
+        meta=MetaInfo(story_id="test_001", seed=137),
+        content=Content(
+            setting=Setting(place="Test", time="Now"),
+            characters=[],
+        ),
+    )
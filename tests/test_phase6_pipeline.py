@@ -11,7 +11,6 @@ Tests cover:
 """
 
 import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -121,14 +120,11 @@ def create_test_digest() -> ExemplarDigest:
 class TestGenerateSingleCandidate:
     """Test single candidate generation."""
 
-    def test_generate_single_candidate_basic(self):
+    def test_generate_single_candidate_basic(self, story_spec, exemplar_digest):
         """Test basic single candidate generation."""
-        spec = create_test_spec()
-        digest = create_test_digest()
-
         candidate = generate_single_candidate(
-            spec=spec,
-            digest=digest,
+            spec=story_spec,
+            digest=exemplar_digest,
             exemplar_text=SAMPLE_EXEMPLAR,
             candidate_id="cand_001",
             run_id="test_run_001",
@@ -174,17 +170,14 @@ class TestGenerateSingleCandidate:
 class TestSelectBestCandidate:
     """Test candidate selection logic."""
 
-    def test_select_best_by_overall_score(self):
+    def test_select_best_by_overall_score(self, story_spec, exemplar_digest):
         """Test selection based on overall score."""
-        spec = create_test_spec()
-        digest = create_test_digest()
-
         # Generate multiple candidates
         candidates = []
         for i in range(3):
             candidate = generate_single_candidate(
-                spec=spec,
-                digest=digest,
+                spec=story_spec,
+                digest=exemplar_digest,
                 exemplar_text=SAMPLE_EXEMPLAR,
                 candidate_id=f"cand_{i+1:03d}",
                 run_id="test_run_select",
@@ -217,14 +210,11 @@ class TestSelectBestCandidate:
 class TestGenerateCandidates:
     """Test multi-candidate generation orchestrator."""
 
-    def test_generate_candidates_default(self):
+    def test_generate_candidates_default(self, story_spec, exemplar_digest):
         """Test default multi-candidate generation."""
-        spec = create_test_spec()
-        digest = create_test_digest()
-
         result = generate_candidates(
-            spec=spec,
-            digest=digest,
+            spec=story_spec,
+            digest=exemplar_digest,
             exemplar_text=SAMPLE_EXEMPLAR,
             n_candidates=3,
         )
@@ -242,6 +232,8 @@ class TestGenerateCandidates:
             assert "stitched" in candidate
             assert "repaired" in candidate
             assert "eval" in candidate
+            for beat in candidate["beats"]:
+                assert beat["metadata"]["tokens"]["total_tokens"] > 0
 
         # Verify best_id
         best_id = result["best_id"]
@@ -254,14 +246,11 @@ class TestGenerateCandidates:
         assert "generation_timestamp" in meta
         assert meta["story_id"] == "test_story_001"
 
-    def test_generate_candidates_with_run_id(self):
+    def test_generate_candidates_with_run_id(self, story_spec, exemplar_digest):
         """Test candidate generation with specified run_id."""
-        spec = create_test_spec()
-        digest = create_test_digest()
-
         result = generate_candidates(
-            spec=spec,
-            digest=digest,
+            spec=story_spec,
+            digest=exemplar_digest,
             exemplar_text=SAMPLE_EXEMPLAR,
             n_candidates=2,
             run_id="custom_run_123",
@@ -272,64 +261,48 @@ class TestGenerateCandidates:
         for candidate in result["candidates"]:
             assert candidate["eval"].run_id == "custom_run_123"
 
-    def test_generate_candidates_persistence(self):
-        """Test that candidates are persisted to /runs/ directory."""
-        spec = create_test_spec()
-        digest = create_test_digest()
-
-        # Use temporary directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Change to temp directory
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmpdir)
-
-                result = generate_candidates(
-                    spec=spec,
-                    digest=digest,
-                    exemplar_text=SAMPLE_EXEMPLAR,
-                    n_candidates=2,
-                    run_id="persist_test",
-                )
-
-                # Verify directory structure
-                run_dir = Path("runs") / "persist_test"
-                assert run_dir.exists()
-
-                # Verify run metadata
-                assert (run_dir / "run_metadata.json").exists()
-                assert (run_dir / "summary.json").exists()
-
-                # Verify candidate directories
-                for candidate in result["candidates"]:
-                    cand_dir = run_dir / candidate["id"]
-                    assert cand_dir.exists()
-
-                    # Verify candidate files
-                    assert (cand_dir / "repaired.txt").exists()
-                    assert (cand_dir / "stitched.txt").exists()
-                    assert (cand_dir / "beat_results.json").exists()
-                    assert (cand_dir / "eval_report.json").exists()
-                    assert (cand_dir / "metadata.json").exists()
-
-                    # Verify content
-                    with open(cand_dir / "repaired.txt", encoding="utf-8") as f:
-                        text = f.read()
-                        assert text == candidate["repaired"]
-
-            finally:
-                os.chdir(original_cwd)
-
-    def test_generate_candidates_single(self):
-        """Test generating a single candidate."""
-        spec = create_test_spec()
-        digest = create_test_digest()
+    def test_generate_candidates_persistence(self, story_spec, exemplar_digest, tmp_path):
+        """Test that candidates are persisted to the runs directory."""
+        result = generate_candidates(
+            spec=story_spec,
+            digest=exemplar_digest,
+            exemplar_text=SAMPLE_EXEMPLAR,
+            n_candidates=2,
+            run_id="persist_test",
+            output_dir=str(tmp_path / "runs"),
+        )
 
+        # Verify directory structure
+        run_dir = tmp_path / "runs" / "persist_test"
+        assert run_dir.exists()
+
+        # Verify run metadata
+        assert (run_dir / "run_metadata.json").exists()
+        assert (run_dir / "summary.json").exists()
+        assert not list(run_dir.rglob("*.tmp"))
+
+        # Verify candidate directories
+        for candidate in result["candidates"]:
+            cand_dir = run_dir / candidate["id"]
+            assert cand_dir.exists()
+
+            # Verify candidate files
+            assert (cand_dir / "repaired.txt").exists()
+            assert (cand_dir / "stitched.txt").exists()
+            assert (cand_dir / "beat_results.json").exists()
+            assert (cand_dir / "eval_report.json").exists()
+            assert (cand_dir / "metadata.json").exists()
+
+            # Verify content
+            with open(cand_dir / "repaired.txt", encoding="utf-8") as f:
+                text = f.read()
+                assert text == candidate["repaired"]
+
+    def test_generate_candidates_single(self, story_spec, exemplar_digest):
+        """Test generating a single candidate."""
         result = generate_candidates(
-            spec=spec,
-            digest=digest,
+            spec=story_spec,
+            digest=exemplar_digest,
             exemplar_text=SAMPLE_EXEMPLAR,
             n_candidates=1,
         )
@@ -337,6 +310,19 @@ class TestGenerateCandidates:
         assert len(result["candidates"]) == 1
         assert result["best_id"] == result["candidates"][0]["id"]
 
+    def test_generate_candidates_concurrent_order(self, story_spec, exemplar_digest):
+        """Test that concurrently generated candidates keep their order."""
+        result = generate_candidates(
+            spec=story_spec,
+            digest=exemplar_digest,
+            exemplar_text=SAMPLE_EXEMPLAR,
+            n_candidates=4,
+            max_workers=4,
+        )
+
+        ids = [c["id"] for c in result["candidates"]]
+        assert ids == ["cand_001", "cand_002", "cand_003", "cand_004"]
+
 
 class TestLLMRouting:
     """Test LLM routing integration."""
@@ -433,3 +419,18 @@ class TestLLMRouting:
             import literary_structure_generator.llm.router as router_module
 
             importlib.reload(router_module)
+
+
+# Fixtures
+
+
+@pytest.fixture(scope="module")
+def story_spec():
+    """StorySpec shared across tests; none of them mutate it."""
+    return create_test_spec()
+
+
+@pytest.fixture(scope="module")
+def exemplar_digest():
+    """ExemplarDigest shared across tests; none of them mutate it."""
+    return create_test_digest()
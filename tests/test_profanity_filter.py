@@ -4,10 +4,15 @@ Tests for profanity filtering functionality.
 Validates structural [bleep] replacement, edge cases, and integration.
 """
 
+import re
+
 import pytest
 
 from literary_structure_generator.utils.profanity import (
+    _CASE_FOLD_TABLE,
+    PROFANITY_LIST,
     apply_profanity_filter,
+    contains_profanity,
     count_bleeps,
     structural_bleep,
 )
@@ -110,6 +115,24 @@ class TestCountBleeps:
         assert count_bleeps(None) == 0
 
 
+class TestContainsProfanity:
+    """Test profanity presence check."""
+
+    def test_contains_profanity(self):
+        """Test detection of profanity."""
+        assert contains_profanity("What the HELL is this")
+        assert not contains_profanity("This is a clean sentence")
+
+    def test_contains_profanity_word_boundaries(self):
+        """Test substrings inside clean words are not flagged."""
+        assert not contains_profanity("The assessment was classic")
+
+    def test_contains_profanity_empty(self):
+        """Test empty input is clean."""
+        assert not contains_profanity("")
+        assert not contains_profanity(None)
+
+
 class TestApplyProfanityFilter:
     """Test high-level profanity filter application."""
 
@@ -221,6 +244,20 @@ class TestEdgeCases:
         result = structural_bleep(text)
         assert result == "Line 1 with [bleep]\nLine 2 with\t[bleep]"
 
+    def test_case_insensitive_unicode_letters(self):
+        """Test letters that match ASCII only under case-insensitive regex."""
+        assert structural_bleep("SH\u0130T and \u017fhit and b\u0131tch") == (
+            "[bleep] and [bleep] and [bleep]"
+        )
+
+    def test_prefilter_covers_case_insensitive_matches(self):
+        """Test the prefilter folds every character the pattern can match."""
+        letters = "".join(sorted(set("".join(PROFANITY_LIST))))
+        every_char = "".join(chr(c) for c in range(0x10000) if not 0xD800 <= c <= 0xDFFF)
+        for char in set(re.findall(f"[{letters}]", every_char, re.IGNORECASE)):
+            folded = char.translate(_CASE_FOLD_TABLE).lower()
+            assert folded in letters, char
+
 
 class TestIntegrationScenarios:
     """Test integration scenarios matching actual use cases."""
@@ -6,9 +6,6 @@ Validates ReasonLog schema and decision logging functionality.
 
 import json
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 from literary_structure_generator.models.reason_log import ReasonLog
 from literary_structure_generator.utils.decision_logger import log_decision, load_decision_logs
@@ -70,38 +67,34 @@ class TestReasonLog:
             reasoning="Test reasoning",
         )
         assert log.timestamp is not None
-        assert "T" in log.timestamp  # ISO 8601 format
+        assert log.timestamp.tzinfo is not None
+
+        # Serialized as ISO 8601 and read back to the same instant
+        assert "T" in json.loads(log.model_dump_json())["timestamp"]
+        assert ReasonLog.model_validate_json(log.model_dump_json()).timestamp == log.timestamp
 
 
 class TestDecisionLogger:
     """Test decision logging utilities."""
 
-    def setup_method(self):
-        """Create temporary directory for test outputs."""
-        self.test_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-
-    def test_log_decision_creates_file(self):
-        """Test that log_decision creates a JSON file."""
+    def test_log_decision_creates_file(self, tmp_path):
+        """Test that log_decision creates a JSON Lines file."""
         log = log_decision(
             run_id="test_run",
             iteration=0,
             agent="SpecSynth",
             decision="Test decision",
             reasoning="Test reasoning",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
 
         # Check that file was created
-        log_dir = Path(self.test_dir) / "test_run" / "iter_0" / "reason_logs"
+        log_dir = tmp_path / "test_run" / "iter_0" / "reason_logs"
         assert log_dir.exists()
-        log_files = list(log_dir.glob("SpecSynth_*.json"))
+        log_files = list(log_dir.glob("SpecSynth.jsonl"))
         assert len(log_files) == 1
 
-    def test_log_decision_with_parameters(self):
+    def test_log_decision_with_parameters(self, tmp_path):
         """Test logging with parameters and metadata."""
         log = log_decision(
             run_id="test_run",
@@ -112,21 +105,21 @@ class TestDecisionLogger:
             parameters={"step_size": 0.1, "beta1": 0.8},
             outcome="Config updated",
             metadata={"convergence": False},
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
 
         # Load and verify content
-        log_dir = Path(self.test_dir) / "test_run" / "iter_1" / "reason_logs"
-        log_files = list(log_dir.glob("Optimizer_*.json"))
+        log_dir = tmp_path / "test_run" / "iter_1" / "reason_logs"
+        log_files = list(log_dir.glob("Optimizer.jsonl"))
         assert len(log_files) == 1
 
         with open(log_files[0]) as f:
-            data = json.load(f)
+            data = json.loads(f.readline())
             assert data["agent"] == "Optimizer"
             assert data["parameters"]["step_size"] == 0.1
             assert data["outcome"] == "Config updated"
 
-    def test_log_multiple_decisions(self):
+    def test_log_multiple_decisions(self, tmp_path):
         """Test logging multiple decisions."""
         for i in range(3):
             log_decision(
@@ -135,15 +128,20 @@ class TestDecisionLogger:
                 agent="Generator",
                 decision=f"Generate candidate {i}",
                 reasoning=f"Creating candidate {i}",
-                output_dir=self.test_dir,
+                output_dir=str(tmp_path),
             )
 
-        # Check that all files were created
-        log_dir = Path(self.test_dir) / "test_run" / "iter_0" / "reason_logs"
-        log_files = list(log_dir.glob("Generator_*.json"))
-        assert len(log_files) == 3
+        # Check that all decisions were appended to one file, in order
+        log_dir = tmp_path / "test_run" / "iter_0" / "reason_logs"
+        log_files = list(log_dir.glob("Generator*.jsonl"))
+        assert len(log_files) == 1
+
+        lines = log_files[0].read_text().splitlines()
+        assert [json.loads(line)["decision"] for line in lines] == [
+            f"Generate candidate {i}" for i in range(3)
+        ]
 
-    def test_load_decision_logs_all(self):
+    def test_load_decision_logs_all(self, tmp_path):
         """Test loading all decision logs for a run."""
         # Create some logs
         log_decision(
@@ -152,7 +150,7 @@ class TestDecisionLogger:
             agent="Digest",
             decision="Decision 1",
             reasoning="Reason 1",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
         log_decision(
             run_id="test_run",
@@ -160,15 +158,15 @@ class TestDecisionLogger:
             agent="SpecSynth",
             decision="Decision 2",
             reasoning="Reason 2",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
 
         # Load all logs
-        logs = load_decision_logs("test_run", output_dir=self.test_dir)
+        logs = load_decision_logs("test_run", output_dir=str(tmp_path))
         assert len(logs) == 2
         assert logs[0].agent in ["Digest", "SpecSynth"]
 
-    def test_load_decision_logs_by_iteration(self):
+    def test_load_decision_logs_by_iteration(self, tmp_path):
         """Test loading logs filtered by iteration."""
         # Create logs in different iterations
         log_decision(
@@ -177,7 +175,7 @@ class TestDecisionLogger:
             agent="Generator",
             decision="Iter 0 decision",
             reasoning="Reason",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
         log_decision(
             run_id="test_run",
@@ -185,15 +183,15 @@ class TestDecisionLogger:
             agent="Generator",
             decision="Iter 1 decision",
             reasoning="Reason",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
 
         # Load only iteration 0
-        logs = load_decision_logs("test_run", iteration=0, output_dir=self.test_dir)
+        logs = load_decision_logs("test_run", iteration=0, output_dir=str(tmp_path))
         assert len(logs) == 1
         assert logs[0].iteration == 0
 
-    def test_load_decision_logs_by_agent(self):
+    def test_load_decision_logs_by_agent(self, tmp_path):
         """Test loading logs filtered by agent."""
         # Create logs from different agents
         log_decision(
@@ -202,7 +200,7 @@ class TestDecisionLogger:
             agent="Evaluator",
             decision="Eval decision",
             reasoning="Reason",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
         log_decision(
             run_id="test_run",
@@ -210,15 +208,15 @@ class TestDecisionLogger:
             agent="Optimizer",
             decision="Opt decision",
             reasoning="Reason",
-            output_dir=self.test_dir,
+            output_dir=str(tmp_path),
         )
 
         # Load only Evaluator logs
-        logs = load_decision_logs("test_run", agent="Evaluator", output_dir=self.test_dir)
+        logs = load_decision_logs("test_run", agent="Evaluator", output_dir=str(tmp_path))
         assert len(logs) == 1
         assert logs[0].agent == "Evaluator"
 
-    def test_load_decision_logs_empty_run(self):
+    def test_load_decision_logs_empty_run(self, tmp_path):
         """Test loading logs from non-existent run."""
-        logs = load_decision_logs("nonexistent_run", output_dir=self.test_dir)
+        logs = load_decision_logs("nonexistent_run", output_dir=str(tmp_path))
         assert len(logs) == 0
@@ -126,40 +126,21 @@ class TestConfigurationChanges:
 class TestFinalistsMetadata:
     """Test that finalists mode adds proper metadata."""
 
-    def test_finalists_mode_metadata_present(self, basic_spec, basic_digest):
+    def test_finalists_mode_metadata_present(self, finalists_result):
         """Test that finalists mode adds metadata to result."""
-        exemplar_text = "This is a short exemplar story. It has multiple sentences."
-        
-        # Generate with finalists mode enabled
-        result = generate_candidates(
-            spec=basic_spec,
-            digest=basic_digest,
-            exemplar_text=exemplar_text,
-            n_candidates=3,
-            run_id="test_finalists_run",
-        )
-        
         # Check metadata
-        assert "finalists_only_mode" in result["meta"]
-        assert result["meta"]["finalists_only_mode"] is True
-        assert "num_finalists" in result["meta"]
-        assert result["meta"]["num_finalists"] == 3
+        assert "finalists_only_mode" in finalists_result["meta"]
+        assert finalists_result["meta"]["finalists_only_mode"] is True
+        assert "num_finalists" in finalists_result["meta"]
+        assert finalists_result["meta"]["num_finalists"] == 3
 
-    def test_candidates_have_finalist_flag(self, basic_spec, basic_digest):
+    def test_candidates_have_finalist_flag(self, finalists_result):
         """Test that candidates have is_finalist flag when finalists mode is used."""
-        exemplar_text = "This is a short exemplar story. It has multiple sentences."
-        
-        result = generate_candidates(
-            spec=basic_spec,
-            digest=basic_digest,
-            exemplar_text=exemplar_text,
-            n_candidates=5,
-            run_id="test_finalists_flags",
-        )
-        
+        candidates = finalists_result["candidates"]
+
         # Count finalists
-        finalists = [c for c in result["candidates"] if c["metadata"].get("is_finalist", False)]
-        non_finalists = [c for c in result["candidates"] if not c["metadata"].get("is_finalist", False)]
+        finalists = [c for c in candidates if c["metadata"].get("is_finalist", False)]
+        non_finalists = [c for c in candidates if not c["metadata"].get("is_finalist", False)]
         
         # Should have 3 finalists and 2 non-finalists
         assert len(finalists) == 3
@@ -168,7 +149,7 @@ class TestFinalistsMetadata:
 
 # Fixtures
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_spec():
     """Create a basic StorySpec for testing."""
     from literary_structure_generator.models.story_spec import (
@@ -214,7 +195,7 @@ def basic_spec():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def basic_digest():
     """Create a basic ExemplarDigest for testing."""
     from literary_structure_generator.models.exemplar_digest import (
@@ -243,3 +224,16 @@ def basic_digest():
         motifs={"labels": ["test"]},
         imagery={"palette": ["light"]},
     )
+
+
+@pytest.fixture(scope="module")
+def finalists_result(basic_spec, basic_digest, tmp_path_factory):
+    """Generate five candidates once in finalists mode for the metadata tests."""
+    return generate_candidates(
+        spec=basic_spec,
+        digest=basic_digest,
+        exemplar_text="This is a short exemplar story. It has multiple sentences.",
+        n_candidates=5,
+        run_id="test_finalists_run",
+        output_dir=str(tmp_path_factory.mktemp("runs")),
+    )